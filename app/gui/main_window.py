@@ -1,43 +1,109 @@
 # app/gui/main_window.py
 
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QApplication,
-                            QMessageBox, QLabel, QProgressDialog)
-from PyQt6.QtGui import QScreen
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+                            QMessageBox, QLabel, QPushButton)
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
 from .input_form import InputForm
 from .results_view import ResultsView
-from ..utils.analysis_service import AnalysisService
+from ..model.results import prepare_view_model
+from ..utils.analysis_service import get_service
+from pathlib import Path
+import functools
 import logging
-import time
+import threading
 
-class ModelLoadThread(QThread):
-    """Thread for loading the AI model and performing AI analysis"""
-    finished = pyqtSignal(dict)
+GUI_DIR = Path(__file__).parent
+
+# Give up on the AI analysis if it has not finished after this long
+AI_ANALYSIS_TIMEOUT_MS = 10 * 60 * 1000
+
+# Only show a busy cursor if the basic analysis takes longer than this
+BUSY_CURSOR_DELAY_MS = 100
+
+# Progress updates from the AI task are applied at most this often (~30 Hz)
+PROGRESS_FLUSH_MS = 33
+
+# Submissions arriving within this window are coalesced; only the last one is analyzed
+SUBMIT_COALESCE_MS = 200
+
+
+@functools.cache
+def _load_stylesheet():
+    """Reads style.qss once per process"""
+    return (GUI_DIR / "style.qss").read_text(encoding="utf-8")
+
+
+class _AIAnalysisSignals(QObject):
+    """Signals used by _AIAnalysis to report back to the GUI thread"""
     progress = pyqtSignal(int, str)
-    
+    # One finished section of the analysis: name and its text or list of items
+    partial = pyqtSignal(str, object)
+    finished = pyqtSignal(dict)
+
+
+class _AIAnalysis(QRunnable):
+    """Loads the AI model if needed and performs the AI analysis"""
+
     def __init__(self, analysis_service, data):
         super().__init__()
+        # Kept alive by MainWindow.ai_task so it can still be cancelled
+        self.setAutoDelete(False)
         self.analysis_service = analysis_service
         self.data = data
-        
+        self.signals = _AIAnalysisSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Asks the analysis to stop at the next generated token"""
+        self._cancelled.set()
+
     def run(self):
         try:
             # Report progress
-            self.progress.emit(10, "Loading AI model...")
+            self.signals.progress.emit(10, "Loading AI model...")
             
             # Get AI analysis (this handles loading the model internally)
-            ai_result = self.analysis_service.get_ai_analysis(self.data)
+            ai_result = self.analysis_service.get_ai_analysis(
+                self.data, should_cancel=self._cancelled.is_set,
+                on_section=self.signals.partial.emit)
             
             # Report completion
-            self.progress.emit(100, "AI analysis complete")
+            self.signals.progress.emit(100, "AI analysis complete")
             
             # Return the AI analysis result
-            self.finished.emit(ai_result)
+            self.signals.finished.emit(ai_result)
         except Exception as e:
-            logging.error(f"AI analysis error: {str(e)}")
+            logging.error("AI analysis error: %s", e)
             # Return error information
-            self.finished.emit({"error": str(e)})
+            self.signals.finished.emit({"error": str(e)})
+
+
+class _AnalysisSignals(QObject):
+    """Signals used by _BasicAnalysis to hand results back to the GUI thread"""
+    finished = pyqtSignal(dict, dict, object)  # basic analysis result, submitted data, view model
+    failed = pyqtSignal(str)
+
+
+class _BasicAnalysis(QRunnable):
+    """Runs the basic (non-AI) analysis off the GUI thread"""
+
+    def __init__(self, analysis_service, data, signals):
+        super().__init__()
+        self.analysis_service = analysis_service
+        self.data = data
+        self.signals = signals
+
+    def run(self):
+        try:
+            basic_result = self.analysis_service.get_basic_analysis(self.data)
+            # Format the result for display here too, leaving the GUI thread
+            # only the widget updates
+            view_model = prepare_view_model(basic_result)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(basic_result, self.data, view_model)
+
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -45,26 +111,9 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Health Monitoring Application")
         self.setMinimumSize(900, 700)
 
-        # Set application-wide stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #f0f0f0;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #6c757d;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # Set application-wide stylesheet before any widget is built, so each
+        # widget is polished once against the final rules
+        self.setup_stylesheet()
 
         # Main widget and layout
         main_widget = QWidget()
@@ -75,103 +124,291 @@ class MainWindow(QMainWindow):
 
         # Add application title
         title_label = QLabel("Health Monitor")
-        title_label.setStyleSheet("""
-            font-size: 24px;
-            font-weight: bold;
-            color: white;
-            background-color: #4CAF50;
-            padding: 10px;
-            border-radius: 5px;
-        """)
+        title_label.setObjectName("appTitle")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title_label)
 
         # Setup logging
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
-        # Initialize analysis service
-        self.analysis_service = AnalysisService()
+        # Shared analysis service, so every window uses the same loaded model
+        self.analysis_service = get_service()
+
+        # Results of _BasicAnalysis are delivered back on the GUI thread
+        self._analysis_signals = _AnalysisSignals(self)
+        queued = Qt.ConnectionType.QueuedConnection
+        self._analysis_signals.finished.connect(self.on_basic_analysis_complete, queued)
+        self._analysis_signals.failed.connect(self.on_analysis_failed, queued)
+
+        # Snapshot of what the results view currently shows ("basic" result and
+        # any "ai" sections), so an identical resubmit doesn't rebuild it
+        self._last_snapshot = {}
 
         # Add input form and results view
         self.input_form = InputForm()
         self.results_view = ResultsView()
 
-        # Connect form submission to results update
-        self.input_form.submitted.connect(self.update_results)
+        # Connect form submission to results update, through a short
+        # single-shot timer so a burst of submits runs one analysis
+        self._pending_data = None
+        self._submit_timer = QTimer(self)
+        self._submit_timer.setSingleShot(True)
+        self._submit_timer.setInterval(SUBMIT_COALESCE_MS)
+        self._submit_timer.timeout.connect(self._run_pending_submission)
+        self.input_form.submitted.connect(self._queue_submission)
+
+        # Busy cursor for a basic analysis that doesn't come back right away
+        self._busy_cursor_shown = False
+        self._busy_cursor_timer = QTimer(self)
+        self._busy_cursor_timer.setSingleShot(True)
+        self._busy_cursor_timer.setInterval(BUSY_CURSOR_DELAY_MS)
+        self._busy_cursor_timer.timeout.connect(self._show_busy_cursor)
+
+        # AI analysis is on by default; load the model while the user fills in
+        # the form so the first submit doesn't pay for it. A model load cannot
+        # be interrupted, so it runs on a daemon thread that doesn't hold up
+        # closing the application
+        if self.input_form.ai_analysis_checkbox.isChecked():
+            threading.Thread(target=self.analysis_service.preload_model,
+                             name="model-preload", daemon=True).start()
 
         # Add widgets to layout
         layout.addWidget(self.input_form)
         layout.addWidget(self.results_view)
         
-        # Initialize progress bar for AI analysis
-        self.ai_progress = None
-        
-        # Center the window on screen
-        self.center_window()
+        # While the AI analysis runs, the results pane shows a busy indicator
+        # and the status bar its progress message and a Cancel button, so
+        # nothing covers the results or takes focus
+        self.ai_cancel_button = QPushButton("Cancel")
+        self.ai_cancel_button.clicked.connect(self.cancel_ai_analysis)
+        self.statusBar().addPermanentWidget(self.ai_cancel_button)
+
+        # Latest progress message from the AI task, applied by _flush_progress
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._hide_ai_progress()
+
+        # AI inference is sequential; one dedicated worker thread is reused
+        # for every submit instead of starting a thread each time
+        self.ai_pool = QThreadPool(self)
+        self.ai_pool.setMaxThreadCount(1)
+        self.ai_task = None
+        # Abandoned tasks still running on the pool, by their signals object;
+        # each is released once it reports back
+        self._abandoned_ai_tasks = {}
+
+        # Watchdog for the AI analysis task
+        self.ai_timeout = QTimer(self)
+        self.ai_timeout.setSingleShot(True)
+        self.ai_timeout.setInterval(AI_ANALYSIS_TIMEOUT_MS)
+        self.ai_timeout.timeout.connect(self.on_ai_analysis_timeout)
+
+        # Centered on its screen when first shown, see showEvent
+        self._centered = False
+
+    def setup_stylesheet(self):
+        """Applies style.qss to the whole application"""
+        app = QApplication.instance()
+        qss = _load_stylesheet()
+        # Re-setting an identical sheet would still re-polish every widget
+        if app.styleSheet() != qss:
+            app.setStyleSheet(qss)
 
     def center_window(self):
         """Center the main window on the screen"""
-        center = QScreen.availableGeometry(QApplication.primaryScreen()).center()
+        center = self.screen().availableGeometry().center()
         geo = self.frameGeometry()
         geo.moveCenter(center)
         self.move(geo.topLeft())
 
+    def showEvent(self, event):
+        """Center the window the first time it is shown, once its screen is known"""
+        super().showEvent(event)
+        if not self._centered:
+            self.center_window()
+            self._centered = True
+
+    def _queue_submission(self, data):
+        """Keep the latest submitted data and (re)start the coalescing timer"""
+        self._pending_data = data
+        self._submit_timer.start()
+
+    def _run_pending_submission(self):
+        data, self._pending_data = self._pending_data, None
+        if data is not None:
+            self.update_results(data)
+
     def update_results(self, data):
         """
-        Process submitted data, perform analysis, and update the results view.
+        Start the analysis of submitted data; results are shown as they arrive.
         
         Args:
             data: Dictionary containing form data
         """
-        # Show busy cursor only briefly for basic analysis
+        # Drop any AI analysis still running for an earlier submit, whether or
+        # not this one asks for AI
+        self._abandon_ai_task()
+
+        # Block resubmission until the basic analysis is in; the busy cursor
+        # only appears if that takes noticeably long
+        self._busy_cursor_timer.start()
+        self.input_form.submit_button.setEnabled(False)
+
+        # STEP 1: Perform basic analysis on the thread pool
+        self.logger.info("Performing basic analysis...")
+        QThreadPool.globalInstance().start(
+            _BasicAnalysis(self.analysis_service, data, self._analysis_signals))
+
+    def _show_busy_cursor(self):
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        self._busy_cursor_shown = True
+
+    def _end_busy_cursor(self):
+        self._busy_cursor_timer.stop()
+        if self._busy_cursor_shown:
+            QApplication.restoreOverrideCursor()
+            self._busy_cursor_shown = False
+
+    def on_basic_analysis_complete(self, basic_result, data, view_model=None):
+        """
+        Show the basic analysis and start the AI analysis if requested.
         
+        Args:
+            basic_result: Dictionary with basic analysis results
+            data: Dictionary containing form data
+            view_model: ResultsViewModel prepared from basic_result
+        """
+        # Restore cursor once the basic analysis is displayed
+        self._end_busy_cursor()
+        self.input_form.submit_button.setEnabled(True)
+
         try:
-            # STEP 1: Perform immediate basic analysis
-            self.logger.info("Performing basic analysis...")
-            
-            # Get basic analysis result (this is fast)
-            basic_result = self.analysis_service.get_basic_analysis(data)
-            
             # Update the results view with basic analysis
-            self.results_view.update_results(basic_result)
-            
-            # Restore cursor after basic analysis is displayed
-            QApplication.restoreOverrideCursor()
+            self._push_basic_result(basic_result, view_model)
             
             # STEP 2: Check if AI analysis is requested
             use_ai = data.get('preferences', {}).get('use_ai_analysis', False)
             
             if use_ai:
-                # Show a small progress bar for AI analysis
-                self.ai_progress = QProgressDialog("Preparing AI analysis...", "Cancel", 0, 100, self)
-                self.ai_progress.setWindowTitle("AI Analysis")
-                self.ai_progress.setMinimumDuration(500)  # Show after 500ms
-                self.ai_progress.setValue(5)
-                self.ai_progress.setWindowModality(Qt.WindowModality.NonModal)  # Allow interaction with main window
+                # Basic results of earlier submits can still arrive after a
+                # newer one; never replace a task without abandoning it
+                self._abandon_ai_task()
+
+                # Show AI analysis progress in the status bar
+                self._show_ai_progress("Preparing AI analysis...")
                 
-                # Start AI analysis in a separate thread
-                self.ai_thread = ModelLoadThread(self.analysis_service, data)
-                self.ai_thread.progress.connect(self.update_ai_progress)
-                self.ai_thread.finished.connect(self.on_ai_analysis_complete)
-                self.ai_thread.start()
+                # Start AI analysis on the AI worker thread
+                self.ai_task = _AIAnalysis(self.analysis_service, data)
+                # Always emitted from the AI worker thread, so always queued
+                queued = Qt.ConnectionType.QueuedConnection
+                self.ai_task.signals.progress.connect(self.update_ai_progress, queued)
+                self.ai_task.signals.partial.connect(self._push_ai_section, queued)
+                self.ai_task.signals.finished.connect(self.on_ai_analysis_complete, queued)
+                self.ai_pool.start(self.ai_task)
+                self.ai_timeout.start()
                 
         except Exception as e:
-            self.logger.error(f"Error during analysis: {str(e)}")
-            QMessageBox.critical(
-                self,
-                "Analysis Error",
-                f"An error occurred during analysis: {str(e)}"
-            )
-            QApplication.restoreOverrideCursor()
+            self.on_analysis_failed(str(e))
+
+    def _push_basic_result(self, basic_result, view_model=None):
+        """Show a basic result, unless the view already shows exactly that"""
+        # Shallow copy: the view adds the AI analysis to the dict it was given
+        snapshot = {"basic": dict(basic_result)}
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self.results_view.update_results(basic_result, view_model)
+
+    def _push_ai_section(self, name, payload):
+        self._last_snapshot.setdefault("ai", {})[name] = payload
+        self.results_view.add_ai_section(name, payload)
+
+    def _push_ai_result(self, ai_result):
+        self._last_snapshot["ai"] = ai_result
+        self.results_view.add_ai_analysis(ai_result)
+
+    def on_analysis_failed(self, message):
+        """Report an analysis error to the user"""
+        self._end_busy_cursor()
+        self.input_form.submit_button.setEnabled(True)
+
+        self.logger.error("Error during analysis: %s", message)
+        QMessageBox.critical(
+            self,
+            "Analysis Error",
+            f"An error occurred during analysis: {message}"
+        )
     
+    def _show_ai_progress(self, message):
+        self.results_view.start_ai_busy()
+        self.ai_cancel_button.setEnabled(True)
+        self.ai_cancel_button.show()
+        self.statusBar().showMessage(message)
+
+    def _hide_ai_progress(self):
+        # Drop a queued update so it can't bring back a stale message
+        self._progress_timer.stop()
+        self._pending_progress = None
+        self.results_view.stop_ai_busy()
+        self.ai_cancel_button.hide()
+        self.statusBar().clearMessage()
+
     def update_ai_progress(self, value, message):
-        """Update AI progress dialog"""
-        if self.ai_progress:
-            self.ai_progress.setLabelText(message)
-            self.ai_progress.setValue(value)
+        """Queue an AI progress message; only the latest one per tick is shown"""
+        self._pending_progress = message
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        if self._pending_progress is None:
+            self._progress_timer.stop()
+            return
+        message, self._pending_progress = self._pending_progress, None
+        self.statusBar().showMessage(message)
+
+    def cancel_ai_analysis(self):
+        """Ask the running AI analysis to stop; it reports back as cancelled"""
+        if self.ai_task is not None:
+            self.ai_task.cancel()
+            self.ai_cancel_button.setEnabled(False)
+            self.statusBar().showMessage("Cancelling AI analysis...")
     
+    def _abandon_ai_task(self):
+        """Cancel the current AI analysis and ignore whatever it still reports"""
+        self.ai_timeout.stop()
+        task, self.ai_task = self.ai_task, None
+        if task is not None:
+            task.cancel()
+            task.signals.progress.disconnect()
+            task.signals.partial.disconnect()
+            task.signals.finished.disconnect()
+            # The pool doesn't own the task (no auto-delete), so it must stay
+            # referenced until it has stopped running; a task still queued is
+            # taken back and can go right away
+            if not self.ai_pool.tryTake(task):
+                self._abandoned_ai_tasks[task.signals] = task
+                task.signals.finished.connect(
+                    self._release_abandoned_ai_task, Qt.ConnectionType.QueuedConnection)
+            self.results_view.discard_ai_stream()
+
+        self._hide_ai_progress()
+
+    def _release_abandoned_ai_task(self):
+        self._abandoned_ai_tasks.pop(self.sender(), None)
+
+    def on_ai_analysis_timeout(self):
+        """Stop waiting for an AI analysis that ran past AI_ANALYSIS_TIMEOUT_MS"""
+        self._abandon_ai_task()
+
+        self.logger.warning("AI analysis timed out")
+        QMessageBox.information(
+            self,
+            "AI Analysis Timed Out",
+            "The AI analysis took too long and was stopped. Basic analysis is still accurate and complete."
+        )
+
     def on_ai_analysis_complete(self, ai_result):
         """
         Handle completed AI analysis and update the display.
@@ -179,14 +416,21 @@ class MainWindow(QMainWindow):
         Args:
             ai_result: Dictionary with AI analysis results
         """
-        # Close progress dialog
-        if self.ai_progress:
-            self.ai_progress.close()
-            self.ai_progress = None
+        self.ai_timeout.stop()
+        self.ai_task = None
+
+        # Clear the status bar progress
+        self._hide_ai_progress()
         
+        # Cancelled by the user; keep the basic analysis as it is
+        if ai_result.get("cancelled"):
+            self.logger.info("AI analysis cancelled")
+            self.results_view.discard_ai_stream()
+            return
+
         # Check for errors
         if "error" in ai_result:
-            self.logger.warning(f"AI analysis warning: {ai_result['error']}")
+            self.logger.warning("AI analysis warning: %s", ai_result['error'])
             # Show a small notification but don't disrupt the user experience
             QMessageBox.information(
                 self,
@@ -195,4 +439,13 @@ class MainWindow(QMainWindow):
             )
         
         # Update the results with AI analysis
-        self.results_view.add_ai_analysis(ai_result)
\ No newline at end of file
+        self._push_ai_result(ai_result)
+
+    def closeEvent(self, event):
+        """Stop a running AI analysis before the window goes away"""
+        self._abandon_ai_task()
+        # Generation stops at the next token, and a model load still in
+        # progress is left to its own thread; wait so the worker thread is
+        # not destroyed while still running
+        self.ai_pool.waitForDone()
+        super().closeEvent(event)
@@ -0,0 +1,177 @@
+# app/gui/parameter_table.py
+import re
+
+from PyQt6.QtWidgets import QLineEdit, QStyledItemDelegate
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QLocale
+from PyQt6.QtGui import QColor, QDoubleValidator, QValidator
+from app.model.parameters.parameter_lookups import PARAM_UI_CACHE, PARAM_UI_CACHE_SORTED, get_placeholder
+
+# Plain decimal number with a period or comma as the decimal separator;
+# anything else is stored as "no value" without raising
+_NUM_RE = re.compile(r'[+-]?\d+(?:[.,]\d*)?|[+-]?[.,]\d+').fullmatch
+# A comma before exactly three digits reads as a thousands group ("4,500"),
+# so it is rejected rather than taken as a decimal comma
+_GROUPED_RE = re.compile(r'[+-]?[1-9]\d{0,2},\d{3}').fullmatch
+
+
+def _parse_value(text):
+    """Returns the number entered as text, or None if it is not a plain decimal number"""
+    text = text.strip()
+    if not _NUM_RE(text) or _GROUPED_RE(text):
+        return None
+    return float(text.replace(',', '.'))
+
+
+class ParameterTableModel(QAbstractTableModel):
+    """Table model holding the blood parameters of one group and their entered values"""
+
+    NAME_COLUMN, VALUE_COLUMN, RANGE_COLUMN, UNIT_COLUMN = range(4)
+    HEADERS = ("Parameter", "Value", "Range", "Units")
+
+    _RANGE_COLOR = QColor("#888888")
+
+    def __init__(self, group_name, parent=None):
+        super().__init__(parent)
+        # One list per column, indexed by row
+        self._names = []
+        self._ranges = []
+        self._units = []
+        self._tooltips = []
+        for param_name, _ in PARAM_UI_CACHE_SORTED[group_name]:
+            _, tooltip, unit, _ = PARAM_UI_CACHE[param_name]
+            self._names.append(param_name)
+            self._ranges.append(get_placeholder(param_name))
+            self._units.append(unit)
+            self._tooltips.append(tooltip)
+        self._values = [None] * len(self._names)
+        self._dirty = set()  # Rows currently holding a value
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.VALUE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == self.NAME_COLUMN:
+                return self._names[row]
+            if column == self.VALUE_COLUMN:
+                value = self._values[row]
+                return "" if value is None else f"{value:.15g}"
+            if column == self.RANGE_COLUMN:
+                return self._ranges[row]
+            return self._units[row]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._tooltips[row]
+        if role == Qt.ItemDataRole.ForegroundRole and column == self.RANGE_COLUMN:
+            # Other columns use the table's text color from style.qss
+            return self._RANGE_COLOR
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or index.column() != self.VALUE_COLUMN or role != Qt.ItemDataRole.EditRole:
+            return False
+        row = index.row()
+        number = _parse_value(str(value))
+        self._values[row] = number
+        if number is None:
+            self._dirty.discard(row)
+        else:
+            self._dirty.add(row)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def values(self):
+        """Returns dictionary of the entered parameter values"""
+        # Only visit rows that hold a value, in display order
+        return {self._names[row]: self._values[row] for row in sorted(self._dirty)}
+
+    def clear_values(self):
+        """Clears every entered value"""
+        if not self._dirty:
+            return
+        first, last = min(self._dirty), max(self._dirty)
+        for row in self._dirty:
+            self._values[row] = None
+        self._dirty.clear()
+        self.dataChanged.emit(
+            self.index(first, self.VALUE_COLUMN),
+            self.index(last, self.VALUE_COLUMN)
+        )
+
+
+class _OptionalDoubleValidator(QDoubleValidator):
+    """
+    QDoubleValidator that also accepts an empty field, meaning no value, and
+    follows the model's decimal separator rule
+    """
+
+    def validate(self, text, pos):
+        # The delegate only commits acceptable input, so an empty field must
+        # be acceptable for a value to be cleared
+        if not text.strip():
+            return QValidator.State.Acceptable, text, pos
+        if _GROUPED_RE(text.strip()):
+            return QValidator.State.Invalid, text, pos
+        # The C locale only knows the period, so check a decimal comma as one
+        state, _, _ = super().validate(text.replace(',', '.'), pos)
+        return state, text, pos
+
+
+class ParameterValueDelegate(QStyledItemDelegate):
+    """Edits the value column with a QLineEdit restricted to plain decimal numbers"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # One validator shared by every editor this delegate creates
+        self._validator = _OptionalDoubleValidator(0.0, 1e9, 6, self)
+        self._validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        locale = QLocale.c()
+        locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+        self._validator.setLocale(locale)
+        # Editors released by the view, kept for the next cell to be edited
+        self._editor_pool = []
+
+    def createEditor(self, parent, option, index):
+        if self._editor_pool:
+            editor = self._editor_pool.pop()
+            editor.setParent(parent)
+        else:
+            editor = QLineEdit(parent)
+            editor.setValidator(self._validator)
+
+        # Show the reference range while the field is empty
+        editor.setPlaceholderText(index.siblingAtColumn(ParameterTableModel.RANGE_COLUMN).data())
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(Qt.ItemDataRole.EditRole))
+
+    def setModelData(self, editor, model, index):
+        # Moving through cells opens an editor on each one; only write back
+        # values the user actually changed
+        if not editor.isModified():
+            return
+        # Incomplete input such as "." is treated as no value
+        text = editor.text() if editor.hasAcceptableInput() else ""
+        model.setData(index, text, Qt.ItemDataRole.EditRole)
+
+    def destroyEditor(self, editor, index):
+        # Keep the editor instead of deleting it; setEditorData resets its text
+        self._editor_pool.append(editor)
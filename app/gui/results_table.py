@@ -0,0 +1,93 @@
+# app/gui/results_table.py
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QFont
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Read-only table model of analyzed blood parameters, grouped by panel"""
+
+    HEADERS = ("Tests", "Result", "Reference Interval", "Units", "Status")
+    STATUS_COLUMN = 4
+
+    _GROUP_COLOR = QColor("#1b7097")
+    _GROUP_BACKGROUND = QColor("#f8f9fa")
+    _ROW_BACKGROUNDS = (QColor("#ffffff"), QColor("#f8f8f8"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # (texts, status_color) per row; group header rows hold just (name,)
+        # and no color
+        self._rows = []
+        self._bold = QFont()
+        self._bold.setBold(True)
+
+    def set_rows(self, rows):
+        """
+        Replaces every row; see _rows for the row layout. If there are rows
+        and they name the same groups and parameters in the same order as
+        before, only the rows whose texts or color changed are updated.
+
+        Returns:
+            True if the model was reset, so the view must redo row spans and
+            sizes
+        """
+        if rows and self._layout_of(rows) == self._layout_of(self._rows):
+            old_rows, self._rows = self._rows, rows
+            last_column = self.columnCount() - 1
+            for row, (old, new) in enumerate(zip(old_rows, rows)):
+                if old != new:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+            return False
+
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        return True
+
+    @staticmethod
+    def _layout_of(rows):
+        """Name of each row, and whether it is a group header row"""
+        return [(texts[0], status_color is None) for texts, status_color in rows]
+
+    def is_group_row(self, row):
+        return self._rows[row][1] is None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        texts, status_color = self._rows[row]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return texts[column] if column < len(texts) else None
+        if status_color is None:
+            # Group header row
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._GROUP_COLOR
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._GROUP_BACKGROUND
+            if role == Qt.ItemDataRole.FontRole:
+                return self._bold
+            return None
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._ROW_BACKGROUNDS[row % 2]
+        if column == self.STATUS_COLUMN:
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return status_color
+            if role == Qt.ItemDataRole.FontRole:
+                return self._bold
+        return None
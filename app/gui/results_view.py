@@ -1,8 +1,92 @@
+import html
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                            QScrollArea, QFrame, QGridLayout, QPushButton)
+                            QScrollArea, QFrame, QPushButton,
+                            QProgressBar, QTableView, QHeaderView,
+                            QAbstractItemView)
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QColor, QPalette
+from ..model.results import prepare_view_model
 from ..utils.pdf_generator import PDFGenerator
+from .results_table import ResultsTableModel
+
+# Rows of the patient and test information cards: key, label
+PATIENT_DETAILS = (
+    ("name", "Name:"),
+    ("gender", "Gender:"),
+    ("age", "Age:"),
+    ("height", "Height:"),
+    ("weight", "Weight:"),
+)
+TEST_DETAILS = (
+    ("lab_name", "Lab Name:"),
+    ("date", "Test Date:"),
+    ("fasting_state", "Fasting State:"),
+)
+
+# Width of each column of the blood parameters table, see ResultsTableModel.HEADERS
+RESULTS_COLUMN_WIDTHS = (150, 120, 150, 120, 100)
+
+# Title and accent colour of the list sections of the AI analysis, in display order
+AI_SECTION_STYLES = {
+    "abnormal_values": ("Abnormal Values Analysis", "#FFA500"),  # Orange
+    "implications": ("Health Implications", "#1b7097"),  # Blue
+    "recommendations": ("Recommendations", "#6cad7a"),  # Green
+    "followup_tests": ("Suggested Follow-up Tests", "#1b7097"),
+}
+
+
+def _make_label(text, object_name, center=False, wrap=False, color=None):
+    """
+    Creates a QLabel styled through style.qss by its object name.
+
+    Args:
+        text: Label text
+        object_name: Object name style.qss matches the label by
+        center: Center the text horizontally and vertically
+        wrap: Wrap long text over several lines
+        color: Accent color for labels whose style.qss rule leaves the color unset
+    """
+    label = QLabel(text)
+    label.setObjectName(object_name)
+    if center:
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    if wrap:
+        label.setWordWrap(True)
+    if color:
+        palette = label.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(color))
+        label.setPalette(palette)
+    return label
+
+
+def _bullet_label(items, empty_text=""):
+    """
+    Creates one plain-text label listing items as bullet lines.
+
+    Args:
+        items: Texts of the bullets
+        empty_text: Text shown, without a bullet, if there are no items
+    """
+    text = "• " + "\n• ".join(items) if items else empty_text
+    label = _make_label(text, "entryBullet")
+    label.setTextFormat(Qt.TextFormat.PlainText)
+    return label
+
+
+def _details_html(details, values):
+    """
+    Renders "Label: value" rows as a rich-text table for a details card.
+
+    Args:
+        details: Rows of the card: key, label
+        values: Display text keyed like details
+    """
+    rows = "".join(
+        f'<tr><td width="50%" style="padding: 5px 20px 5px 0; color: #333333;"><b>{label}</b></td>'
+        f'<td style="padding: 5px 0;">{html.escape(values[key])}</td></tr>'
+        for key, label in details)
+    return f'<table width="100%" cellspacing="0" cellpadding="0">{rows}</table>'
+
 
 class ResultsView(QWidget):
     def __init__(self):
@@ -11,10 +95,11 @@ class ResultsView(QWidget):
         self.scroll = QScrollArea()
         self.scroll.setWidgetResizable(True)
         self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self.scroll.setStyleSheet("border: none; background-color: transparent;")
+        self.scroll.setObjectName("resultsScroll")
 
         # Create container widget for scroll area
         self.container = QWidget()
+        self.container.setObjectName("resultsContainer")
         self.layout = QVBoxLayout(self.container)
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(15)  # Increase spacing between elements
@@ -26,25 +111,21 @@ class ResultsView(QWidget):
 
         # Add download PDF button
         self.download_pdf_button = QPushButton("Download PDF")
-        self.download_pdf_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4a148c;
-                color: white;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #6a1b9a;
-            }
-            QPushButton:disabled {
-                background-color: #9e9e9e;
-            }
-        """)
+        self.download_pdf_button.setObjectName("downloadPdfButton")
         self.download_pdf_button.clicked.connect(self.download_as_pdf)
         self.download_pdf_button.setEnabled(False)  # Disabled until we have results
         self.download_pdf_button.setFixedWidth(150)
 
+        # Busy indicator while an AI analysis is still running; the basic
+        # results below stay usable meanwhile
+        self.ai_busy = QProgressBar()
+        self.ai_busy.setRange(0, 0)  # Indeterminate
+        self.ai_busy.setTextVisible(False)
+        self.ai_busy.setFixedWidth(200)
+        self.ai_busy.setToolTip("AI analysis in progress")
+        self.ai_busy.hide()
+        button_layout.addWidget(self.ai_busy)
+
         # Add button with right alignment
         button_layout.addStretch()
         button_layout.addWidget(self.download_pdf_button)
@@ -60,9 +141,17 @@ class ResultsView(QWidget):
         self.scroll.setWidget(self.container)
         main_layout.addWidget(self.scroll)
 
+        # The results widgets are built once and refilled by each
+        # update_results; hidden until there are results to show
+        self._build_results()
+        self.container.hide()
+
         # Initialize data to None
         self.current_data = None
 
+        # Content layout of an AI analysis being filled in by add_ai_section
+        self._ai_stream_layout = None
+
          # Add storage for formatted AI analysis that will be used for PDF generation
         self.formatted_ai_analysis = {
             "summary": "",
@@ -76,130 +165,21 @@ class ResultsView(QWidget):
         # Initialize PDF generator
         self.pdf_generator = PDFGenerator()
 
-    def update_results(self, data):
-        """Updates the results view to match professional medical report format"""
-        # Store the data for PDF generation
-        self.current_data = data
-
-        # Enable the download button
-        self.download_pdf_button.setEnabled(True)
-        # Clear previous results
-        for i in reversed(range(self.layout.count())):
-            widget = self.layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
+    def _build_results(self):
+        """Builds the widgets showing a result, which update_results fills in"""
         # Create header section with title
-        header = QLabel("Blood Test Results")
-        header.setStyleSheet("""
-            font-size: 18px;
-            font-weight: bold;
-            color: #ffffff;
-            padding: 15px;
-            background-color: #6cad7a;
-            border-radius: 6px;
-        """)
-        header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.layout.addWidget(header)
+        self.layout.addWidget(_make_label("Blood Test Results", "resultsTitle", center=True))
 
         # Create two-column layout for patient and specimen info
         info_layout = QHBoxLayout()
         info_layout.setSpacing(15)  # Space between columns
 
         # Patient Information Column
-        patient_box = QWidget()
-        patient_box.setStyleSheet("""
-            background-color: white;
-            border-radius: 6px;
-            border: 1px solid #e6e6e6;
-        """)
-        patient_layout = QVBoxLayout(patient_box)
-        patient_layout.setContentsMargins(0, 0, 0, 20)  # Remove vertical padding
-
-        patient_header = QLabel("Patient Information")
-        patient_header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #1b7097;
-            padding: 10px;
-            text-align: center;
-            background-color: #f5f5f5;
-            border-bottom: 1px solid #e6e6e6;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        """)
-        patient_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        patient_layout.addWidget(patient_header)
-
-        # Get patient info
-        patient_info = data.get('patient', {})
-        patient_grid = QGridLayout()
-        patient_grid.setContentsMargins(15, 15, 15, 15)
-        patient_grid.setVerticalSpacing(10)
-        patient_details = [
-            ("Name:", f"{patient_info.get('first_name', '')} {patient_info.get('last_name', '')}"),
-            ("Gender:", patient_info.get('gender', '')),
-            ("Age:", f"{patient_info.get('age', '')} years"),
-            ("Height:", f"{patient_info.get('height', '')} cm"),
-            ("Weight:", f"{patient_info.get('weight', '')} kg"),
-        ]
-
-        for i, (label, value) in enumerate(patient_details):
-            label_widget = QLabel(label)
-            label_widget.setStyleSheet("font-weight: bold; color: #333333;")
-            value_widget = QLabel(value)
-            value_widget.setStyleSheet("color: #666666;")
-            patient_grid.addWidget(label_widget, i, 0)
-            patient_grid.addWidget(value_widget, i, 1)
-
-        patient_layout.addLayout(patient_grid)
+        patient_box, self._patient_details = self._create_details_card("Patient Information")
         info_layout.addWidget(patient_box, 1)  # Equal width
-        
+
         # Test Information Column
-        test_box = QWidget()
-        test_box.setStyleSheet("""
-            background-color: white;
-            border-radius: 6px;
-            border: 1px solid #e6e6e6;
-        """)
-        test_layout = QVBoxLayout(test_box)
-        test_layout.setContentsMargins(0, 0, 0, 20)  # Remove vertical padding
-
-        test_header = QLabel("Test Information")
-        test_header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #1b7097;
-            padding: 10px;
-            text-align: center;
-            background-color: #f5f5f5;
-            border-bottom: 1px solid #e6e6e6;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        """)
-        test_header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        test_layout.addWidget(test_header)
-
-        # Get test info
-        test_info = data.get('test', {})
-        test_grid = QGridLayout()
-        test_grid.setContentsMargins(15, 15, 15, 15)
-        test_grid.setVerticalSpacing(10)
-        test_details = [
-            ("Lab Name:", test_info.get('lab_name', '')),
-            ("Test Date:", str(test_info.get('date', ''))),
-            ("Fasting State:", "Yes" if patient_info.get('fasting_state', False) else "No"),
-        ]
-
-        for i, (label, value) in enumerate(test_details):
-            label_widget = QLabel(label)
-            label_widget.setStyleSheet("font-weight: bold; color: #333333;")
-            value_widget = QLabel(value)
-            value_widget.setStyleSheet("color: #666666;")
-            test_grid.addWidget(label_widget, i, 0)
-            test_grid.addWidget(value_widget, i, 1)
-
-        test_layout.addLayout(test_grid)
+        test_box, self._test_details = self._create_details_card("Test Information")
         info_layout.addWidget(test_box, 1)  # Equal width
 
         # Add info section to main layout
@@ -207,62 +187,131 @@ class ResultsView(QWidget):
         info_widget.setLayout(info_layout)
         self.layout.addWidget(info_widget)
 
-        # Create results section
-        results_section = QWidget()
-        results_section.setStyleSheet("""
-            background-color: white;
-            border-radius: 6px;
-            border: 1px solid #e6e6e6;
-        """)
-        results_layout = QVBoxLayout(results_section)
-        results_layout.setContentsMargins(0, 0, 0, 15)  # Reduce bottom padding
-
-        # Create table headers with elegant styling
-        headers_widget = QWidget()
-        headers_widget.setStyleSheet("""
-            background-color: #f5f5f5;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-            border-bottom: 1px solid #e6e6e6;
-        """)
-        headers_layout = QHBoxLayout(headers_widget)
-        headers_layout.setContentsMargins(15, 10, 15, 10)
-        headers = ["Tests", "Result", "Reference Interval", "Units", "Status"]
-        header_widths = [150, 120, 130, 120, 100]
-
-        for i, header in enumerate(headers):
-            label = QLabel(header)
-            label.setStyleSheet("""
-                font-weight: bold;
-                color: #1b7097;
-            """)
-            label.setFixedWidth(header_widths[i])
-            headers_layout.addWidget(label)
-
-        results_layout.addWidget(headers_widget)
-
-        # Create content widget for blood parameters
+        # Blood parameters table
+        self.results_table = self._create_results_table()
+        self.layout.addWidget(self.results_table)
+
+        # Values requiring attention, then AI analysis; each shown only when
+        # it has content
+        self.attention_card, self._attention_layout = self._create_card(
+            "Values Requiring Attention", spacing=20)
+        self.layout.addWidget(self.attention_card)
+        self._shown_attention = None  # Entries the attention card was built for
+        self.ai_card, self._ai_content_layout = self._create_card(
+            "AI Analysis & Recommendations", spacing=15)
+        self.layout.addWidget(self.ai_card)
+
+        # Add stretch at the end
+        self.layout.addStretch()
+
+    def _create_card(self, title, spacing):
+        """
+        Creates a white card with a header, hidden until it is given content.
+
+        Returns:
+            Tuple of the card widget and the layout its content goes in
+        """
+        card = QWidget()
+        card.setObjectName("resultsCard")
+        card_layout = QVBoxLayout(card)
+        card_layout.setContentsMargins(0, 0, 0, 15)
+
+        # Add section header
+        card_layout.addWidget(_make_label(title, "cardHeader"))
+
+        # Create content widget
         content_widget = QWidget()
         content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(0, 0, 0, 0)
-        content_layout.setSpacing(0)  # No spacing between rows for clean look
+        content_layout.setContentsMargins(15, 15, 15, 0)
+        content_layout.setSpacing(spacing)  # Space between entries
 
-        # Add blood parameters to content
-        self._add_blood_parameters(content_layout, data.get('blood_parameters', {}), header_widths)
+        card_layout.addWidget(content_widget)
+        card.hide()
+        return card, content_layout
 
-        results_layout.addWidget(content_widget)
-        self.layout.addWidget(results_section)
+    def _create_details_card(self, title):
+        """
+        Creates a card of "Label: value" rows.
+
+        Returns:
+            Tuple of the card widget and the rich-text label holding its rows
+        """
+        box = QWidget()
+        box.setObjectName("resultsCard")
+        box_layout = QVBoxLayout(box)
+        box_layout.setContentsMargins(0, 0, 0, 20)  # Remove vertical padding
+
+        box_layout.addWidget(_make_label(title, "cardHeader", center=True))
+
+        # One label renders every row; see _details_html
+        details = _make_label("", "detailText")
+        details.setTextFormat(Qt.TextFormat.RichText)
+        details.setContentsMargins(15, 10, 15, 10)
+        box_layout.addWidget(details)
+        return box, details
+
+    @staticmethod
+    def _renew_card_content(card):
+        """
+        Replaces the content widget of a _create_card card with an empty one.
+        The old one is deleted with all its entries by Qt in one go.
+
+        Returns:
+            The layout the new content goes in
+        """
+        card_layout = card.layout()
+        old_content = card_layout.itemAt(1).widget()
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        content_layout.setContentsMargins(old_content.layout().contentsMargins())
+        content_layout.setSpacing(old_content.layout().spacing())
+        card_layout.replaceWidget(old_content, content_widget)
+        old_content.setParent(None)
+        old_content.deleteLater()
+        return content_layout
+
+    def update_results(self, data, view_model=None):
+        """
+        Updates the results view to match professional medical report format
+
+        Args:
+            data: Analysis result to show
+            view_model: prepare_view_model(data), when already prepared off
+                the GUI thread
+        """
+        if view_model is None:
+            view_model = prepare_view_model(data)
+
+        # Store the data for PDF generation
+        self.current_data = data
+        self._ai_stream_layout = None
+
+        # Enable the download button
+        self.download_pdf_button.setEnabled(True)
+
+        # Fill with updates disabled so the results are laid out and painted
+        # once, when complete
+        self.scroll.viewport().setUpdatesEnabled(False)
+        try:
+            self.container.show()
+            self._fill_results(data, view_model)
+        finally:
+            self.scroll.viewport().setUpdatesEnabled(True)
+
+    def _fill_results(self, data, view_model):
+        """Fills every part of the results view from data and its view model"""
+        self._patient_details.setText(_details_html(PATIENT_DETAILS, view_model.patient))
+        self._test_details.setText(_details_html(TEST_DETAILS, view_model.test))
+
+        # Fill the blood parameters table
+        self._populate_results_table(view_model.table_rows)
 
         # CHANGED ORDER: First add attention section for abnormal values
-        self._add_attention_section(data.get('blood_parameters', {}))
+        self._add_attention_section(view_model.attention)
 
         # THEN add AI analysis section if present in data
-        if 'ai_analysis' in data:
-            self._add_ai_analysis(data.get('ai_analysis', {}))
+        self._add_ai_analysis(data.get('ai_analysis', {}))
 
-        # Add stretch at the end
-        self.layout.addStretch()
-        
     def download_as_pdf(self):
         """Handles PDF download button click"""
         if self.current_data:
@@ -275,153 +324,77 @@ class ResultsView(QWidget):
                     "PDF report was successfully generated."
                 )
 
-    def _add_blood_parameters(self, layout, parameters, column_widths):
-        """Adds blood parameters to the layout with alternating row colors"""
-        # Sort and group parameters
-        grouped_params = {}
-        for name, data in parameters.items():
-            group = data.get('group', 'Other')
-            if group not in grouped_params:
-                grouped_params[group] = []
-            grouped_params[group].append((name, data))
-
-        row_index = 0
-        # Display parameters by group
-        for group in sorted(grouped_params.keys()):
-            # Add group header
-            group_header = QLabel(group)
-            group_header.setStyleSheet("""
-                font-weight: bold;
-                color: #1b7097;
-                padding: 8px 15px;
-                background-color: #f8f9fa;
-            """)
-            layout.addWidget(group_header)
-            row_index += 1
-
-            # Add parameters
-            for name, data in sorted(grouped_params[group]):
-                # Create row with alternating background
-                row_widget = QWidget()
-                bg_color = "#ffffff" if row_index % 2 == 0 else "#f8f8f8"
-                row_widget.setStyleSheet(f"background-color: {bg_color};")
-                row_layout = QHBoxLayout(row_widget)
-                row_layout.setContentsMargins(15, 5, 15, 5)
-
-                # Parameter name
-                name_label = QLabel(name)
-                name_label.setStyleSheet("color: #333333;")
-                name_label.setFixedWidth(column_widths[0])
-                row_layout.addWidget(name_label)
-
-                # Value
-                value = data.get('value', 'N/A')
-                value_label = QLabel(f"{value}")
-                value_label.setFixedWidth(column_widths[1])
-                row_layout.addWidget(value_label)
-
-                # Reference range
-                range_vals = data.get('range', [None, None])
-                if range_vals and len(range_vals) == 2 and range_vals[0] is not None and range_vals[1] is not None:
-                    range_str = f"{range_vals[0]}-{range_vals[1]}"
-                else:
-                    range_str = "Not specified"
-                range_label = QLabel(range_str)
-                range_label.setFixedWidth(column_widths[2])
-                row_layout.addWidget(range_label)
-
-                # Units
-                unit_label = QLabel(data.get('unit', ''))
-                unit_label.setFixedWidth(column_widths[3])
-                row_layout.addWidget(unit_label)
-
-                # Status
-                if value != 'N/A':
-                    try:
-                        value_float = float(value)
-                        status, color = self._get_status_and_color(value_float, data)
-                    except (ValueError, TypeError) as e:
-                        status, color = "Error", "#808080"
-                else:
-                    status, color = "No data", "#808080"
-
-                status_label = QLabel(status)
-                status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-                status_label.setFixedWidth(column_widths[4])
-                row_layout.addWidget(status_label)
+    def _create_results_table(self):
+        """Creates the blood parameters table, reused by every update_results"""
+        table = QTableView()
+        table.setModel(ResultsTableModel(table))
+        table.setObjectName("resultsTable")
+        header = table.horizontalHeader()
+        header.setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        # Column widths are set once here; rows never resize them
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        for column, width in enumerate(RESULTS_COLUMN_WIDTHS):
+            table.setColumnWidth(column, width)
+        header.setStretchLastSection(True)
+        # Every row is the same height, so the view never measures rows
+        table.verticalHeader().hide()
+        table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(30)
+        table.setShowGrid(False)
+        table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # The enclosing scroll area scrolls; the table is sized to its rows
+        # and only paints (and asks the model for) the rows scrolled into view
+        table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        return table
+
+    def _populate_results_table(self, table_rows):
+        """Fills the results table with prepared rows, see ResultsViewModel"""
+        rows = [(texts, None if color is None else QColor(color)) for texts, color in table_rows]
+
+        table = self.results_table
+        model = table.model()
+        if not model.set_rows(rows):
+            return  # Same rows as before, changed in place
+
+        # Group headers span all columns
+        table.clearSpans()
+        for row in range(len(rows)):
+            if model.is_group_row(row):
+                table.setSpan(row, 0, 1, model.columnCount())
+
+        # Show every row; the table itself never scrolls
+        table.ensurePolished()
+        table.setFixedHeight(table.horizontalHeader().sizeHint().height()
+                             + table.verticalHeader().length()
+                             + 2 * table.frameWidth())
+
+    def _add_attention_section(self, attention):
+        """Adds a section highlighting values requiring attention with improved styling"""
+        if attention == self._shown_attention:
+            return  # Same entries, keep their widgets
+        self._shown_attention = attention
 
-                layout.addWidget(row_widget)
-                row_index += 1
+        # Filled while hidden: children added to a visible widget are only
+        # shown, and laid out, on a later event loop pass
+        self.attention_card.hide()
+        content_layout = self._attention_layout = self._renew_card_content(self.attention_card)
 
-    def _add_attention_section(self, parameters):
-        """Adds a section highlighting values requiring attention with improved styling"""
-        # Find parameters that are out of range
-        attention_params = []
-
-        for name, data in parameters.items():
-            value = data.get('value', 'N/A')
-            if value != 'N/A':
-                try:
-                    value_float = float(value)
-                    status, color = self._get_status_and_color(value_float, data)
-                    if status not in ["Normal", "No data", "Error"]:
-                        attention_params.append((name, data, status, color))
-                except (ValueError, TypeError):
-                    continue
-
-        if attention_params:
-            # Add section container
-            attention_section = QWidget()
-            attention_section.setStyleSheet("""
-                background-color: white;
-                border-radius: 6px;
-                border: 1px solid #e6e6e6;
-            """)
-            attention_layout = QVBoxLayout(attention_section)
-            attention_layout.setContentsMargins(0, 0, 0, 15)
-
-            # Add section header
-            attention_header = QLabel("Values Requiring Attention")
-            attention_header.setStyleSheet("""
-                font-size: 16px;
-                font-weight: bold;
-                color: #1b7097;
-                padding: 10px 15px;
-                background-color: #f5f5f5;
-                border-bottom: 1px solid #e6e6e6;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-            """)
-            attention_layout.addWidget(attention_header)
-
-            # Create content for abnormal values
-            content_widget = QWidget()
-            content_layout = QVBoxLayout(content_widget)
-            content_layout.setContentsMargins(15, 15, 15, 0)
-            content_layout.setSpacing(20)  # Space between entries
-
-            for name, data, status, color in attention_params:
+        if attention:
+            for entry in attention:
                 # Create entry for each parameter
                 param_widget = QWidget()
-                param_widget.setStyleSheet("""
-                    background-color: #f9f9f9;
-                    border-radius: 4px;
-                    padding: 5px;
-                """)
+                param_widget.setObjectName("attentionEntry")
                 param_layout = QVBoxLayout(param_widget)
                 param_layout.setContentsMargins(10, 10, 10, 10)
                 param_layout.setSpacing(8)
 
                 # Parameter header with value and status
                 header_layout = QHBoxLayout()
-                header = QLabel(f"{name}:")
-                header.setStyleSheet("font-weight: bold; color: #1b7097;")
-
-                value_status = QLabel(f"{data.get('value')} {data.get('unit', '')} - {status}")
-                value_status.setStyleSheet(f"color: {color}; font-weight: bold;")
-
-                header_layout.addWidget(header)
-                header_layout.addWidget(value_status)
+                header_layout.addWidget(_make_label(f"{entry.name}:", "entryTitle"))
+                header_layout.addWidget(_make_label(entry.summary, "entryAccent", color=entry.color))
                 header_layout.addStretch(1)
                 param_layout.addLayout(header_layout)
 
@@ -429,64 +402,35 @@ class ResultsView(QWidget):
                 line = QFrame()
                 line.setFrameShape(QFrame.Shape.HLine)
                 line.setFrameShadow(QFrame.Shadow.Sunken)
-                line.setStyleSheet("background-color: #e0e0e0;")
+                line.setObjectName("entrySeparator")
                 param_layout.addWidget(line)
 
                 # Add clinical implications
-                clinical_info = data.get('clinical_info', {})
-                conditions = clinical_info.get('common_conditions', {})
-
                 implications_layout = QVBoxLayout()
-                implications_title = QLabel("Possible causes:")
-                implications_title.setStyleSheet("font-weight: bold; color: #666666;")
-                implications_layout.addWidget(implications_title)
-
-                if status.lower().find('low') != -1 and 'low' in conditions:
-                    for condition in conditions['low']:
-                        condition_label = QLabel(f"• {condition}")
-                        condition_label.setStyleSheet("color: #666666; padding-left: 15px;")
-                        implications_layout.addWidget(condition_label)
-                elif status.lower().find('high') != -1 and 'high' in conditions:
-                    for condition in conditions['high']:
-                        condition_label = QLabel(f"• {condition}")
-                        condition_label.setStyleSheet("color: #666666; padding-left: 15px;")
-                        implications_layout.addWidget(condition_label)
-                else:
-                    no_info = QLabel("No additional information available")
-                    no_info.setStyleSheet("color: #666666; padding-left: 15px;")
-                    implications_layout.addWidget(no_info)
+                implications_layout.addWidget(_make_label("Possible causes:", "entryCaption"))
+
+                implications_layout.addWidget(
+                    _bullet_label(entry.causes, "No additional information available"))
 
                 param_layout.addLayout(implications_layout)
 
                 # Add recommendations if available
-                if 'test_requirements' in data:
-                    reqs = data['test_requirements']
-                    if isinstance(reqs, dict) and reqs.get('special_requirements'):
-                        recommendations_layout = QVBoxLayout()
-                        recommendations_title = QLabel("Recommendations:")
-                        recommendations_title.setStyleSheet("font-weight: bold; color: #666666; margin-top: 5px;")
-                        recommendations_layout.addWidget(recommendations_title)
+                if entry.requirements:
+                    recommendations_layout = QVBoxLayout()
+                    recommendations_title = _make_label("Recommendations:", "entryCaption")
+                    recommendations_title.setProperty("spaced", True)
+                    recommendations_layout.addWidget(recommendations_title)
 
-                        for req in reqs.get('special_requirements', []):
-                            req_label = QLabel(f"• {req}")
-                            req_label.setStyleSheet("color: #666666; padding-left: 15px;")
-                            recommendations_layout.addWidget(req_label)
+                    recommendations_layout.addWidget(_bullet_label(entry.requirements))
 
-                        param_layout.addLayout(recommendations_layout)
+                    param_layout.addLayout(recommendations_layout)
 
                 content_layout.addWidget(param_widget)
 
-            attention_layout.addWidget(content_widget)
-            self.layout.addWidget(attention_section)
-
-    def _add_ai_analysis(self, ai_analysis):
-        """
-        Updates the view with AI-powered analysis results with improved styling.
+        self.attention_card.setVisible(bool(attention))
 
-        Args:
-            ai_analysis: Dictionary containing AI analysis results
-        """
-        # Initialize formatted AI analysis structure for PDF generation
+    def _reset_formatted_ai_analysis(self):
+        """Initialize formatted AI analysis structure for PDF generation"""
         self.formatted_ai_analysis = {
             "summary": "",
             "abnormal_values": [],
@@ -496,158 +440,123 @@ class ResultsView(QWidget):
             "disclaimer": "AI-generated analysis is for informational purposes only and should not replace professional medical advice."
         }
 
+    def _create_ai_section_widget(self, name, payload):
+        """
+        Creates the widget for one section of the AI analysis.
+
+        Args:
+            name: Section name, "summary" or a key of AI_SECTION_STYLES
+            payload: Summary text, or list of items for the other sections
+
+        Returns:
+            The section widget, or None if there is nothing to show
+        """
+        if not payload:
+            return None
+
+        section_widget = QWidget()
+        section_widget.setObjectName("aiSection")
+        section_layout = QVBoxLayout(section_widget)
+        section_layout.setContentsMargins(10, 10, 10, 10)
+
+        if name == "summary":
+            section_layout.addWidget(_make_label("Summary", "entryTitle"))
+            section_layout.addWidget(_make_label(payload, "aiSummary", wrap=True))
+            return section_widget
+
+        if name not in AI_SECTION_STYLES:
+            return None
+        title, icon_color = AI_SECTION_STYLES[name]
+
+        section_layout.addWidget(_make_label(title, "entryAccent", color=icon_color))
+
+        # One label for every item: a table keeps wrapped lines indented
+        # past the bullet
+        rows = "".join(
+            f'<tr><td style="padding: 3px 8px 3px 0; color: {icon_color}; font-weight: bold;">•</td>'
+            f'<td style="padding: 3px 0;">{html.escape(item)}</td></tr>'
+            for item in payload)
+        items_label = _make_label(f'<table cellspacing="0" cellpadding="0">{rows}</table>', "aiItem", wrap=True)
+        items_label.setTextFormat(Qt.TextFormat.RichText)
+        section_layout.addWidget(items_label)
+
+        return section_widget
+
+    def _create_ai_disclaimer(self):
+        return _make_label(
+            "AI-generated analysis is for informational purposes only and should not replace professional medical advice.",
+            "aiDisclaimer", wrap=True)
+
+    def _add_ai_analysis(self, ai_analysis):
+        """
+        Updates the view with AI-powered analysis results with improved styling.
+
+        Args:
+            ai_analysis: Dictionary containing AI analysis results
+        """
+        self._reset_formatted_ai_analysis()
+        # Filled while hidden, like the attention section
+        self.ai_card.hide()
+        content_layout = self._ai_content_layout = self._renew_card_content(self.ai_card)
+
         if not ai_analysis or "error" in ai_analysis:
             # If there's an error or no analysis, don't display anything
             return
 
-        # Store the AI analysis data for PDF generation
-        if "summary" in ai_analysis:
-            self.formatted_ai_analysis["summary"] = ai_analysis["summary"]
-        if "abnormal_values" in ai_analysis:
-            self.formatted_ai_analysis["abnormal_values"] = ai_analysis["abnormal_values"]
-        if "implications" in ai_analysis:
-            self.formatted_ai_analysis["implications"] = ai_analysis["implications"]
-        if "recommendations" in ai_analysis:
-            self.formatted_ai_analysis["recommendations"] = ai_analysis["recommendations"]
-        if "followup_tests" in ai_analysis:
-            self.formatted_ai_analysis["followup_tests"] = ai_analysis["followup_tests"]
-
-        # Create AI analysis section
-        ai_section = QWidget()
-        ai_section.setStyleSheet("""
-            background-color: white;
-            border-radius: 6px;
-            border: 1px solid #e6e6e6;
-        """)
-        ai_layout = QVBoxLayout(ai_section)
-        ai_layout.setContentsMargins(0, 0, 0, 15)
+        for name in ("summary", *AI_SECTION_STYLES):
+            # Store the AI analysis data for PDF generation
+            if name in ai_analysis:
+                self.formatted_ai_analysis[name] = ai_analysis[name]
 
-        # Add section header
-        ai_header = QLabel("AI Analysis & Recommendations")
-        ai_header.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #1b7097;
-            padding: 10px 15px;
-            background-color: #f5f5f5;
-            border-bottom: 1px solid #e6e6e6;
-            border-top-left-radius: 6px;
-            border-top-right-radius: 6px;
-        """)
-        ai_layout.addWidget(ai_header)
-
-        # Create content widget for sections
-        content_widget = QWidget()
-        content_layout = QVBoxLayout(content_widget)
-        content_layout.setContentsMargins(15, 15, 15, 0)
-        content_layout.setSpacing(15)  # Space between sections
-
-        # Add summary section
-        if ai_analysis.get("summary"):
-            summary_widget = QWidget()
-            summary_widget.setStyleSheet("""
-                background-color: #f9f9f9;
-                border-radius: 4px;
-                padding: 10px;
-            """)
-            summary_layout = QVBoxLayout(summary_widget)
-            summary_layout.setContentsMargins(10, 10, 10, 10)
-
-            summary_header = QLabel("Summary")
-            summary_header.setStyleSheet("font-weight: bold; color: #1b7097;")
-            summary_layout.addWidget(summary_header)
-
-            summary_text = QLabel(ai_analysis["summary"])
-            summary_text.setWordWrap(True)
-            summary_text.setStyleSheet("color: #333333; padding: 5px 0;")
-            summary_layout.addWidget(summary_text)
-
-            content_layout.addWidget(summary_widget)
-
-        # Function to add a section with title and items
-        def add_section(title, items, icon_color="#1b7097"):
-            if not items:
-                return
-
-            section_widget = QWidget()
-            section_widget.setStyleSheet("""
-                background-color: #f9f9f9;
-                border-radius: 4px;
-                padding: 10px;
-            """)
-            section_layout = QVBoxLayout(section_widget)
-            section_layout.setContentsMargins(10, 10, 10, 10)
-
-            section_header = QLabel(title)
-            section_header.setStyleSheet(f"font-weight: bold; color: {icon_color};")
-            section_layout.addWidget(section_header)
-
-            for item in items:
-                item_layout = QHBoxLayout()
-                bullet = QLabel("•")
-                bullet.setStyleSheet(f"color: {icon_color}; font-weight: bold;")
-
-                text = QLabel(item)
-                text.setWordWrap(True)
-                text.setStyleSheet("color: #333333;")
-
-                item_layout.addWidget(bullet)
-                item_layout.addWidget(text, 1)  # Give text stretch factor
-
-                section_layout.addLayout(item_layout)
-
-            content_layout.addWidget(section_widget)
-
-        # Add sections using the add_section function
-        add_section("Abnormal Values Analysis", ai_analysis.get("abnormal_values", []), "#FFA500")  # Orange
-        add_section("Health Implications", ai_analysis.get("implications", []), "#1b7097")  # Blue
-        add_section("Recommendations", ai_analysis.get("recommendations", []), "#6cad7a")  # Green
-        add_section("Suggested Follow-up Tests", ai_analysis.get("followup_tests", []))
+            section_widget = self._create_ai_section_widget(name, ai_analysis.get(name))
+            if section_widget:
+                content_layout.addWidget(section_widget)
 
         # Add disclaimer
-        disclaimer = QLabel("AI-generated analysis is for informational purposes only and should not replace professional medical advice.")
-        disclaimer.setWordWrap(True)
-        disclaimer.setStyleSheet("color: #FF5722; font-style: italic; padding: 10px; font-size: 11px;")
-        content_layout.addWidget(disclaimer)
+        content_layout.addWidget(self._create_ai_disclaimer())
 
-        ai_layout.addWidget(content_widget)
-        self.layout.addWidget(ai_section)
+        self.ai_card.show()
 
-    def _get_status_and_color(self, value, param_info):
-        """Enhanced status determination using range values"""
-        try:
-            # Get range values from the parameter info
-            range_vals = param_info.get('range', [None, None])
-            if not range_vals or len(range_vals) != 2:
-                return "No range", "#808080"
-
-            min_val, max_val = range_vals
-
-            if min_val is None or max_val is None:
-                return "No range", "#808080"
-
-            # Convert to float to ensure proper comparison
-            min_val = float(min_val)
-            max_val = float(max_val)
-
-            # Calculate percentage deviation
-            if value < min_val:
-                deviation = ((min_val - value) / min_val) * 100
-                if deviation > 20:
-                    return "Very Low", "#FF0000"  # Red
-                return "Low", "#FFA500"  # Orange
-            elif value > max_val:
-                deviation = ((value - max_val) / max_val) * 100
-                if deviation > 20:
-                    return "Very High", "#FF0000"  # Red
-                return "High", "#FFA500"  # Orange
-            else:
-                return "Normal", "#008000"  # Green
+    def add_ai_section(self, name, payload):
+        """
+        Append one section of an AI analysis that is still running.
+
+        Args:
+            name: Section name, "summary" or a key of AI_SECTION_STYLES
+            payload: Summary text, or list of items for the other sections
+        """
+        if not self.current_data:
+            return  # No results to add to
+
+        if self._ai_stream_layout is None:
+            self._reset_formatted_ai_analysis()
+            self.ai_card.hide()
+            self._ai_content_layout = self._renew_card_content(self.ai_card)
+            self._ai_stream_layout = self._ai_content_layout
+            self.ai_card.show()
+
+        self.formatted_ai_analysis[name] = payload
+        section_widget = self._create_ai_section_widget(name, payload)
+        if section_widget:
+            self._ai_stream_layout.addWidget(section_widget)
+
+    def discard_ai_stream(self):
+        """Remove the sections of an AI analysis that stopped before finishing"""
+        if self._ai_stream_layout is None:
+            return
+        self._ai_stream_layout = None
+        self._reset_formatted_ai_analysis()
+        self.ai_card.hide()
+        self._ai_content_layout = self._renew_card_content(self.ai_card)
+
+    def start_ai_busy(self):
+        """Show the busy indicator for a running AI analysis"""
+        self.ai_busy.show()
+
+    def stop_ai_busy(self):
+        """Hide the AI analysis busy indicator"""
+        self.ai_busy.hide()
 
-        except Exception as e:
-            print(f"Error calculating status: {e}")
-            return "Error", "#808080"
-    
     def add_ai_analysis(self, ai_analysis):
         """
         Add AI analysis to an existing results display.
@@ -660,9 +569,20 @@ class ResultsView(QWidget):
         
         # Add AI analysis to current data
         self.current_data["ai_analysis"] = ai_analysis
+
+        # Sections already streamed in through add_ai_section; just finish off
+        if self._ai_stream_layout is not None and "error" not in ai_analysis:
+            self._ai_stream_layout.addWidget(self._create_ai_disclaimer())
+            self._ai_stream_layout = None
+            return
         
-        # Update the display with the combined data
-        self.update_results(self.current_data)
+        # Show the whole analysis at once
+        self._ai_stream_layout = None
+        self.scroll.viewport().setUpdatesEnabled(False)
+        try:
+            self._add_ai_analysis(ai_analysis)
+        finally:
+            self.scroll.viewport().setUpdatesEnabled(True)
 
     def download_pdf(self):
         """Generate and download a PDF report"""
@@ -1,6 +1,7 @@
 # File: app/main.py
 import sys
 import os
+import logging
 
 # Add the project root directory to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
@@ -10,6 +11,9 @@ from PyQt6.QtWidgets import QApplication
 from app.gui.main_window import MainWindow
 
 def main():
+    # Configure logging once for the whole application
+    logging.basicConfig(level=logging.INFO)
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
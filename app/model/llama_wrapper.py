@@ -2,11 +2,60 @@
 
 import os
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
-from typing import Dict, List, Any, Optional
+from transformers import (AutoModelForCausalLM, AutoTokenizer, StoppingCriteria,
+                          StoppingCriteriaList, TextStreamer)
+from typing import Callable, Dict, List, Any, Optional
 import logging
 import re
 
+class CancelCriteria(StoppingCriteria):
+    """Stops generation as soon as the should_cancel callback returns True"""
+
+    def __init__(self, should_cancel: Callable[[], bool]):
+        self.should_cancel = should_cancel
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        return self.should_cancel()
+
+
+# Each section of the response, with the header that ends it: the header of the
+# next section, as matched by _process_response
+_SECTION_ENDS = (
+    ("summary", re.compile(r'Abnormal Values', re.IGNORECASE)),
+    ("abnormal_values", re.compile(r'Implications', re.IGNORECASE)),
+    ("implications", re.compile(r'Recommendations', re.IGNORECASE)),
+    ("recommendations", re.compile(r'Follow-?up Tests', re.IGNORECASE)),
+)
+
+
+class SectionStreamer(TextStreamer):
+    """
+    Collects the response as it is generated and reports each section as soon
+    as the header of the next one appears
+    """
+
+    def __init__(self, wrapper: "LlamaWrapper", on_section: Callable[[str, Any], None]):
+        super().__init__(wrapper.tokenizer, skip_prompt=True, skip_special_tokens=True)
+        self.wrapper = wrapper
+        self.on_section = on_section
+        self.text = ""
+        self._next = 0  # Index in _SECTION_ENDS of the first unfinished section
+        self._pos = 0  # Where the search for its end header starts
+
+    def on_finalized_text(self, text: str, stream_end: bool = False):
+        self.text += text
+        while self._next < len(_SECTION_ENDS):
+            name, end = _SECTION_ENDS[self._next]
+            match = end.search(self.text, self._pos)
+            if not match:
+                return
+            self._next += 1
+            self._pos = match.start()
+            payload = self.wrapper._process_response(self.text[:match.end()])[name]
+            if payload:
+                self.on_section(name, payload)
+
+
 class LlamaWrapper:
     # Class variable for caching
     _model_cache = None
@@ -59,8 +108,8 @@ class LlamaWrapper:
             return True
             
         try:
-            self.logger.info(f"Loading Medical model from {self.model_path}")
-            self.logger.info(f"Using device: {self.device}")
+            self.logger.info("Loading Medical model from %s", self.model_path)
+            self.logger.info("Using device: %s", self.device)
             
             # Create a dedicated models directory in your application folder
             models_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "models"))
@@ -102,24 +151,34 @@ class LlamaWrapper:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to load model: {str(e)}")
+            self.logger.error("Failed to load model: %s", e)
             return False
     
     def analyze_blood_parameters(self, blood_parameters: Dict[str, Any], 
-                       patient_info: Dict[str, Any]) -> Dict[str, Any]:
+                       patient_info: Dict[str, Any],
+                       should_cancel: Optional[Callable[[], bool]] = None,
+                       on_section: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
         """
         Analyze blood parameters and generate insights using Llama-3-8B-UltraMedical.
         
         Args:
             blood_parameters: Dictionary of blood parameters and their values
             patient_info: Dictionary of patient information
+            should_cancel: Optional callback polled between generated tokens;
+                generation stops once it returns True
+            on_section: Optional callback called with (name, payload) for each
+                non-empty section but the last, as soon as it has been generated
             
         Returns:
-            Dictionary with insights and recommendations
+            Dictionary with insights and recommendations, or {"cancelled": True}
         """
         if not self.model or not self.tokenizer:
             if not self.load_model():
                 return {"error": "Model could not be loaded"}
+
+        # Loading can take minutes; don't start generating if cancelled meanwhile
+        if should_cancel and should_cancel():
+            return {"cancelled": True}
         
         # Construct prompt from blood parameters and patient info
         prompt = self._construct_prompt(blood_parameters, patient_info)
@@ -154,6 +213,14 @@ class LlamaWrapper:
             # Move to device
             inputs = {k: v.to(self.device) for k, v in inputs.items()}
             
+            # Stop between tokens when the caller cancels
+            stopping_criteria = None
+            if should_cancel:
+                stopping_criteria = StoppingCriteriaList([CancelCriteria(should_cancel)])
+
+            # Report sections while the rest of the response is generated
+            streamer = SectionStreamer(self, on_section) if on_section else None
+
             # Generate response
             with torch.no_grad():
                 outputs = self.model.generate(
@@ -164,8 +231,13 @@ class LlamaWrapper:
                     top_p=0.9,
                     do_sample=True,
                     repetition_penalty=1.2,
-                    pad_token_id=self.tokenizer.eos_token_id
+                    pad_token_id=self.tokenizer.eos_token_id,
+                    stopping_criteria=stopping_criteria,
+                    streamer=streamer
                 )
+
+            if should_cancel and should_cancel():
+                return {"cancelled": True}
             
             # Decode response
             response_text = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
@@ -198,7 +270,7 @@ class LlamaWrapper:
             return structured_response
             
         except Exception as e:
-            self.logger.error(f"Error during inference: {str(e)}")
+            self.logger.error("Error during inference: %s", e)
             import traceback
             traceback.print_exc()
             return {"error": f"Analysis failed: {str(e)}"}
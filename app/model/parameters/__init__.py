@@ -1,6 +1,9 @@
 # File: app/model/parameters/__init__.py
 from .parameter_definitions import BLOOD_PARAMETERS
+from .parameter_lookups import (PARAM_TO_GROUP, PARAM_UI_CACHE, PARAM_UI_CACHE_SORTED,
+                                get_placeholder, get_range)
 from .parameter_validators import ParameterValidator
 from .parameter_converters import UnitConverter
 
-__all__ = ['BLOOD_PARAMETERS', 'ParameterValidator', 'UnitConverter']
\ No newline at end of file
+__all__ = ['BLOOD_PARAMETERS', 'PARAM_TO_GROUP', 'PARAM_UI_CACHE', 'PARAM_UI_CACHE_SORTED',
+           'get_placeholder', 'get_range', 'ParameterValidator', 'UnitConverter']
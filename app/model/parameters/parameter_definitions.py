@@ -3,6 +3,8 @@ Defines the structure and values for all blood test parameters.
 This module serves as the single source of truth for parameter definitions.
 """
 
+from types import MappingProxyType
+
 RBC_PARAMETER = {
     'id': 'RBC',
     'name': 'Red Blood Cell Count',
@@ -2439,6 +2441,28 @@ BLOOD_PARAMETERS = {
     }
 }
 
+
+def freeze(value):
+    """Recursively converts dicts to read-only mappings and lists to tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Recursively converts a frozen value back to plain dicts and lists"""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+# The definitions are static; freeze them so no caller can mutate shared state
+BLOOD_PARAMETERS = freeze(BLOOD_PARAMETERS)
+
 """
 Future Parameters to be Added:
 
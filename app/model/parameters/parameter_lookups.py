@@ -0,0 +1,156 @@
+# File: app/model/parameters/parameter_lookups.py
+"""
+Lookup tables derived from BLOOD_PARAMETERS.
+
+The parameter definitions are static, so everything the GUI needs to render
+a parameter row is computed once at import time instead of per widget, and
+range resolution is memoized per (parameter, gender).
+"""
+
+import functools
+from collections.abc import Mapping
+
+from .parameter_definitions import BLOOD_PARAMETERS
+
+
+def _build_placeholder(param_info):
+    """Builds the placeholder text showing the standard range"""
+    ranges = param_info.get('ranges', {})
+
+    # Add standard range if available
+    if 'standard' in ranges:
+        std_range = ranges['standard']
+        min_val = std_range.get('min', 'N/A')
+        max_val = std_range.get('max', 'N/A')
+        return f"{min_val}-{max_val}"
+    return ""
+
+
+def _format_requirement_mapping(test_reqs, tooltip_sections):
+    """Appends tooltip lines for test_requirements given as a mapping"""
+    tooltip_sections.append("\nTest requirements:")
+    if test_reqs.get('fasting_required'):
+        tooltip_sections.append(f"• Fasting required: {test_reqs.get('fasting_duration', '')} hours")
+    if test_reqs.get('special_requirements'):
+        for req in test_reqs['special_requirements']:
+            tooltip_sections.append(f"• {req}")
+
+    # Add interfering factors if present
+    interfering = test_reqs.get('interfering_factors', [])
+    if interfering:
+        tooltip_sections.append("\nInterfering factors:")
+        for factor in interfering:
+            tooltip_sections.append(f"• {factor}")
+
+
+def _format_requirement_sequence(test_reqs, tooltip_sections):
+    """Appends tooltip lines for test_requirements given as a list"""
+    tooltip_sections.append("\nTest requirements:")
+    for req in test_reqs:
+        tooltip_sections.append(f"• {req}")
+
+
+def _build_tooltip(param_name, param_info):
+    """Creates enhanced tooltip with detailed information"""
+    # Create sections for the tooltip
+    tooltip_sections = []
+
+    # Get clinical info
+    clinical_info = param_info.get('clinical_info', {})
+
+    # Add description
+    description = clinical_info.get('description')
+    if description:
+        tooltip_sections.append(description)
+
+    # Add function if available
+    function = clinical_info.get('function')
+    if function:
+        tooltip_sections.append(f"\nFunction: {function}")
+
+    # Add common conditions
+    conditions = clinical_info.get('common_conditions', {})
+    if conditions:
+        tooltip_sections.append("\nCommon conditions:")
+        if 'high' in conditions:
+            high_conditions = ", ".join(conditions['high'])
+            tooltip_sections.append(f"High: {high_conditions}")
+        if 'low' in conditions:
+            low_conditions = ", ".join(conditions['low'])
+            tooltip_sections.append(f"Low: {low_conditions}")
+
+    # Add test requirements
+    test_reqs = param_info.get('test_requirements')
+    if test_reqs and isinstance(test_reqs, Mapping):
+        _format_requirement_mapping(test_reqs, tooltip_sections)
+    elif test_reqs and isinstance(test_reqs, (list, tuple)):
+        _format_requirement_sequence(test_reqs, tooltip_sections)
+
+    # Join all sections with newlines
+    tooltip_text = "\n".join(tooltip_sections)
+
+    # If no content was added, provide a default message
+    if not tooltip_text:
+        tooltip_text = "No additional information available"
+
+    return tooltip_text
+
+
+def _resolve_range(param_info, gender):
+    """Resolves (min, max) for a gender: standard, then gender-specific, then base"""
+    ranges = param_info.get('ranges', {})
+
+    # First try to get from standard ranges
+    if 'standard' in ranges:
+        return ranges['standard'].get('min'), ranges['standard'].get('max')
+    # Then try gender-specific ranges
+    if 'gender_specific' in ranges and gender in ranges['gender_specific']:
+        gender_range = ranges['gender_specific'][gender]
+        return gender_range.get('min'), gender_range.get('max')
+    # Finally try base ranges if they exist
+    if 'base' in ranges and isinstance(ranges['base'], Mapping):
+        if gender in ranges['base']:
+            return ranges['base'][gender].get('min'), ranges['base'][gender].get('max')
+        # If no gender-specific range, use the first available range
+        first_range = next(iter(ranges['base'].values()))
+        return first_range.get('min'), first_range.get('max')
+    return None, None
+
+
+# PARAM_UI_CACHE[param_name] = (placeholder, tooltip, unit, order)
+PARAM_UI_CACHE = {}
+
+# PARAM_UI_CACHE_SORTED[group_name] = [(param_name, param_info), ...] in display order
+PARAM_UI_CACHE_SORTED = {}
+
+# PARAM_TO_GROUP[param_name] = (group_name, param_info)
+PARAM_TO_GROUP = {}
+
+for _group_name, _group_data in BLOOD_PARAMETERS.items():
+    for _param_name, _param_info in _group_data['parameters'].items():
+        PARAM_TO_GROUP[_param_name] = (_group_name, _param_info)
+        PARAM_UI_CACHE[_param_name] = (
+            _build_placeholder(_param_info),
+            _build_tooltip(_param_name, _param_info),
+            _param_info['unit']['standard'],
+            _param_info.get('display', {}).get('order', float('inf'))
+        )
+
+    # Sort parameters by order if available
+    PARAM_UI_CACHE_SORTED[_group_name] = sorted(
+        _group_data['parameters'].items(),
+        key=lambda x: PARAM_UI_CACHE[x[0]][3]
+    )
+
+del _group_name, _group_data, _param_name, _param_info
+
+
+def get_placeholder(param_name):
+    """Returns the placeholder text showing the standard range of a parameter"""
+    return PARAM_UI_CACHE[param_name][0]
+
+
+@functools.cache
+def get_range(param_name, gender):
+    """Returns (range_min, range_max) of a parameter for a gender"""
+    return _resolve_range(PARAM_TO_GROUP[param_name][1], gender)
@@ -0,0 +1,147 @@
+# app/model/results.py
+"""
+Display-ready form of an analysis result, prepared off the GUI thread and
+applied to the results view.
+"""
+
+import itertools
+import operator
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.utils.analysis import UNREMARKABLE_STATUSES, classify_all
+
+
+@dataclass(slots=True, frozen=True)
+class ParamRow:
+    """One blood parameter of an analysis result, read out of its dict once"""
+    name: str
+    value: Any  # As submitted; 'N/A' if missing
+    unit: str
+    group: str
+    range_min: Any  # None, with range_max, if the range is not specified
+    range_max: Any
+    conditions_low: Tuple[str, ...]
+    conditions_high: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class AttentionEntry:
+    name: str
+    summary: str  # "value unit - status"
+    color: str
+    causes: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class ResultsViewModel:
+    patient: Dict[str, str]
+    test: Dict[str, str]
+    # (texts, status_color) per table row; group header rows hold just
+    # (name,) and no color
+    table_rows: Tuple[Tuple[Tuple[str, ...], Optional[str]], ...]
+    attention: Tuple[AttentionEntry, ...]
+
+
+def prepare_view_model(data: Dict[str, Any]) -> ResultsViewModel:
+    """
+    Format an analysis result for display; touches no widgets, so it can run
+    on any thread.
+
+    Args:
+        data: Analysis result as passed to ResultsView.update_results
+
+    Returns:
+        ResultsViewModel with every text and status of the result
+    """
+    patient_info = data.get('patient', {})
+    patient = {
+        'name': f"{patient_info.get('first_name', '')} {patient_info.get('last_name', '')}",
+        'gender': patient_info.get('gender', ''),
+        'age': f"{patient_info.get('age', '')} years",
+        'height': f"{patient_info.get('height', '')} cm",
+        'weight': f"{patient_info.get('weight', '')} kg",
+    }
+
+    test_info = data.get('test', {})
+    # Results from before fasting_state moved to the test carry it on the patient
+    fasting = test_info.get('fasting_state', patient_info.get('fasting_state', False))
+    test = {
+        'lab_name': test_info.get('lab_name', ''),
+        'date': str(test_info.get('date', '')),
+        'fasting_state': "Yes" if fasting else "No",
+    }
+
+    # Classify every parameter once for the table and attention section
+    parameters = data.get('blood_parameters', {})
+    statuses = classify_all(parameters)
+
+    table_rows, attention = _table_rows_and_attention(_to_rows(parameters), statuses)
+    return ResultsViewModel(patient=patient, test=test, table_rows=table_rows, attention=attention)
+
+
+def _to_rows(parameters):
+    """Read every blood parameter dict into a ParamRow"""
+    rows = []
+    for name, data in parameters.items():
+        range_vals = data.get('range')
+        if not range_vals or len(range_vals) != 2 or None in range_vals:
+            range_vals = (None, None)
+
+        conditions = data.get('clinical_info', {}).get('common_conditions', {})
+        reqs = data.get('test_requirements')
+        requirements = ()
+        if isinstance(reqs, dict) and reqs.get('special_requirements'):
+            requirements = tuple(reqs['special_requirements'])
+
+        rows.append(ParamRow(
+            name=name,
+            value=data.get('value', 'N/A'),
+            unit=data.get('unit', ''),
+            group=data.get('group', 'Other'),
+            range_min=range_vals[0],
+            range_max=range_vals[1],
+            conditions_low=tuple(conditions.get('low', ())),
+            conditions_high=tuple(conditions.get('high', ())),
+            requirements=requirements,
+        ))
+    return rows
+
+
+def _table_rows_and_attention(params, statuses):
+    """
+    Build the results table rows, parameters grouped by panel, and the
+    attention entries in one pass over the parameters.
+    """
+    grouped_rows = []  # (group, row)
+    attention = []
+    for param in params:
+        status, color, side = statuses[param.name]
+
+        if param.range_min is not None:
+            range_str = f"{param.range_min}-{param.range_max}"
+        else:
+            range_str = "Not specified"
+        row = ((param.name, f"{param.value}", range_str, param.unit, status), color)
+        grouped_rows.append((param.group, row))
+
+        if status not in UNREMARKABLE_STATUSES:
+            # Possible causes for the side of the range the value is on
+            causes = {'low': param.conditions_low, 'high': param.conditions_high}.get(side, ())
+            attention.append(AttentionEntry(
+                name=param.name,
+                summary=f"{param.value} {param.unit} - {status}",
+                color=color,
+                causes=causes,
+                requirements=param.requirements,
+            ))
+
+    # One sort by group, then name; each group's rows then follow its header
+    grouped_rows.sort(key=lambda group_row: (group_row[0], group_row[1][0][0]))
+    rows = []
+    for group, group_rows in itertools.groupby(grouped_rows, key=operator.itemgetter(0)):
+        rows.append(((group,), None))
+        rows.extend(row for _, row in group_rows)
+    return tuple(rows), tuple(attention)
@@ -0,0 +1,89 @@
+# app/model/submission.py
+"""
+Typed containers for the data collected by the input form on submit.
+"""
+
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from app.model.parameters.parameter_definitions import thaw
+
+
+@dataclass(slots=True, frozen=True)
+class PatientData:
+    first_name: str
+    last_name: str
+    gender: str
+    age: int
+    height: float
+    weight: float
+
+
+@dataclass(slots=True, frozen=True)
+class TestData:
+    date: datetime.date
+    lab_name: str
+    fasting_state: bool
+
+
+@dataclass(slots=True, frozen=True)
+class ParamResult:
+    name: str
+    value: float
+    unit: str
+    group: str
+    range_min: Optional[float]
+    range_max: Optional[float]
+    metadata: Dict[str, Any]
+    clinical_info: Dict[str, Any]
+
+
+@dataclass(slots=True, frozen=True)
+class SubmitPayload:
+    patient: PatientData
+    test: TestData
+    blood_parameters: Tuple[ParamResult, ...]
+    use_ai_analysis: bool
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the payload to the nested dictionary consumed by the analysis
+        service, results view and PDF generator.
+
+        Returns:
+            Dictionary with patient, test, blood_parameters and preferences
+        """
+        patient = self.patient
+        test = self.test
+        return {
+            'patient': {
+                'first_name': patient.first_name,
+                'last_name': patient.last_name,
+                'gender': patient.gender,
+                'age': patient.age,
+                'height': patient.height,
+                'weight': patient.weight
+            },
+            'test': {
+                'date': test.date,
+                'lab_name': test.lab_name,
+                'fasting_state': test.fasting_state
+            },
+            'blood_parameters': {
+                param.name: {
+                    'value': param.value,
+                    'unit': param.unit,
+                    'group': param.group,
+                    'range': [param.range_min, param.range_max],
+                    # Copied out of the frozen definitions, so the payload
+                    # can be deep-copied and pickled
+                    'metadata': thaw(param.metadata),
+                    'clinical_info': thaw(param.clinical_info)
+                }
+                for param in self.blood_parameters
+            },
+            'preferences': {
+                'use_ai_analysis': self.use_ai_analysis
+            }
+        }
@@ -0,0 +1,108 @@
+# app/utils/analysis.py
+import numpy as np
+
+GRAY = "#808080"
+# Every status classify_all reports, with its display color
+STATUS_COLORS = {
+    "Very Low": "#FF0000",  # Red
+    "Low": "#FFA500",  # Orange
+    "Normal": "#008000",  # Green
+    "High": "#FFA500",
+    "Very High": "#FF0000",
+    "No data": GRAY,
+    "No range": GRAY,
+    "Error": GRAY,
+}
+
+# Statuses that need no attention
+UNREMARKABLE_STATUSES = frozenset(("Normal", "No data", "Error"))
+
+# Percentage outside the reference range beyond which a value is "Very" low/high
+SEVERE_DEVIATION = 20
+
+
+def _to_float(value):
+    """Returns value as a number, or None if it is not one"""
+    # Submitted values are already numbers; only parse anything else
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _classified(status, side):
+    """Returns the (status, color, side) entry of classify_all"""
+    return status, STATUS_COLORS[status], side
+
+
+def classify_all(parameters):
+    """
+    Classifies every blood parameter against its reference range in one pass
+
+    Returns a dict mapping parameter name to (status, color, side), side being
+    which side of the range the value is on: "low", "high", "normal", or
+    "unknown" for values that cannot be compared. Those get "No data",
+    "No range" or "Error"; the rest are classified together with NumPy.
+    """
+    results = {}
+    names, values, lows, highs = [], [], [], []
+
+    for name, data in parameters.items():
+        value = data.get('value', 'N/A')
+        if value == 'N/A':
+            results[name] = _classified("No data", "unknown")
+            continue
+        value = _to_float(value)
+        if value is None:
+            results[name] = _classified("Error", "unknown")
+            continue
+
+        range_vals = data.get('range', [None, None])
+        if not range_vals or len(range_vals) != 2 or None in range_vals:
+            results[name] = _classified("No range", "unknown")
+            continue
+        low, high = _to_float(range_vals[0]), _to_float(range_vals[1])
+        if low is None or high is None:
+            results[name] = _classified("Error", "unknown")
+            continue
+
+        names.append(name)
+        values.append(value)
+        lows.append(low)
+        highs.append(high)
+
+    if not names:
+        return results
+
+    values = np.array(values)
+    lows = np.array(lows)
+    highs = np.array(highs)
+
+    is_low = values < lows
+    is_high = ~is_low & (values > highs)
+    # Deviations are percentages of the crossed bound; a zero bound cannot be
+    # expressed that way and is reported as an error
+    with np.errstate(divide='ignore', invalid='ignore'):
+        low_deviation = (lows - values) / lows * 100
+        high_deviation = (values - highs) / highs * 100
+    is_error = (is_low & (lows == 0)) | (is_high & (highs == 0))
+
+    statuses = np.select(
+        [
+            is_error,
+            is_low & (low_deviation > SEVERE_DEVIATION),
+            is_low,
+            is_high & (high_deviation > SEVERE_DEVIATION),
+            is_high,
+        ],
+        ["Error", "Very Low", "Low", "Very High", "High"],
+        default="Normal",
+    )
+
+    sides = np.select([is_error, is_low, is_high], ["unknown", "low", "high"], default="normal")
+
+    for name, status, side in zip(names, statuses.tolist(), sides.tolist()):
+        results[name] = _classified(status, side)
+    return results
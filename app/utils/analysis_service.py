@@ -1,9 +1,19 @@
 # app/utils/analysis_service.py
 
 from ..model.llama_wrapper import LlamaWrapper
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, Optional
+import functools
 import logging
-import time
+import threading
+
+# Sections of an AI analysis, in the order they are reported to on_section
+AI_SECTIONS = ("summary", "abnormal_values", "implications", "recommendations", "followup_tests")
+
+# Number of basic analyses remembered by get_basic_analysis (oldest evicted first)
+BASIC_CACHE_SIZE = 32
+
+# Seconds between checks of should_cancel while get_ai_analysis waits for the model
+LOAD_CANCEL_POLL_S = 0.1
 
 class AnalysisService:
     def __init__(self, model_path: str = None, lazy_loading: bool = True):
@@ -17,6 +27,11 @@ class AnalysisService:
         self.logger = logging.getLogger(__name__)
         self.model = LlamaWrapper(model_path=model_path)
         self.model_loaded = False
+        # Serializes loading between preload_model and the first analysis
+        self._load_lock = threading.Lock()
+        # Basic analyses keyed by the blood parameter values and ranges they were computed from
+        self._basic_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._basic_cache_lock = threading.Lock()
         
         # If not lazy loading, load the model right away
         if not lazy_loading:
@@ -31,14 +46,30 @@ class AnalysisService:
         """
         if self.model_loaded:
             return True
-            
-        try:
-            success = self.model.load_model()
-            self.model_loaded = success
-            return success
-        except Exception as e:
-            self.logger.error(f"Failed to load model: {str(e)}")
-            return False
+
+        with self._load_lock:
+            # Another thread may have finished loading while we waited
+            if self.model_loaded:
+                return True
+            try:
+                success = self.model.load_model()
+                self.model_loaded = success
+                return success
+            except Exception as e:
+                self.logger.error("Failed to load model: %s", e)
+                return False
+
+    def preload_model(self) -> bool:
+        """
+        Load the AI model ahead of the first analysis. Safe to call from a
+        background thread; an analysis started meanwhile waits for this load
+        instead of starting its own.
+        
+        Returns:
+            bool: Success status
+        """
+        self.logger.info("Preloading AI model...")
+        return self.load_model()
     
     def get_basic_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -50,8 +81,21 @@ class AnalysisService:
         Returns:
             Dictionary with basic analysis results
         """
-        # Perform basic analysis
-        basic_analysis = self._perform_basic_analysis(data['blood_parameters'])
+        # Perform basic analysis, unless these exact parameters were analyzed
+        # recently (e.g. resubmitting after toggling AI analysis). The key holds
+        # only what the analysis reads, in order, as that is the result's order
+        key = tuple(
+            (name, param.get('value'), tuple(param.get('range') or ()))
+            for name, param in data['blood_parameters'].items()
+        )
+        with self._basic_cache_lock:
+            basic_analysis = self._basic_cache.get(key)
+        if basic_analysis is None:
+            basic_analysis = self._perform_basic_analysis(data['blood_parameters'])
+            with self._basic_cache_lock:
+                if len(self._basic_cache) >= BASIC_CACHE_SIZE:
+                    del self._basic_cache[next(iter(self._basic_cache))]
+                self._basic_cache[key] = basic_analysis
         
         # Return result with basic analysis
         return {
@@ -62,22 +106,72 @@ class AnalysisService:
             # No AI analysis yet
         }
     
-    def get_ai_analysis(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _wait_for_model(self, should_cancel: Optional[Callable[[], bool]]) -> bool:
+        """
+        Load the model, giving up on waiting once should_cancel returns True.
+        Loading can't be interrupted, so it runs on a daemon thread that may
+        outlive a cancelled analysis without holding up the application exit.
+
+        Returns:
+            bool: False if cancelled before the model was ready
+        """
+        if should_cancel is None:
+            self.load_model()
+            return True
+        if should_cancel():
+            return False
+        if not self.model_loaded:
+            loader = threading.Thread(target=self.load_model, name="model-load", daemon=True)
+            loader.start()
+            while loader.is_alive():
+                if should_cancel():
+                    return False
+                loader.join(LOAD_CANCEL_POLL_S)
+        return not should_cancel()
+
+    def get_ai_analysis(self, data: Dict[str, Any],
+                        should_cancel: Optional[Callable[[], bool]] = None,
+                        on_section: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
         """
         Perform AI analysis.
         
         Args:
             data: Dictionary containing patient info and blood parameters
+            should_cancel: Optional callback; the analysis stops early once it returns True
+            on_section: Optional callback called with (name, payload) for each
+                non-empty section in AI_SECTIONS, as soon as it has been generated
             
         Returns:
-            Dictionary with AI analysis results
+            Dictionary with AI analysis results, or {"cancelled": True}
         """
         try:
+            # Wait for a preload in progress rather than loading a second copy
+            if not self._wait_for_model(should_cancel):
+                return {"cancelled": True}
+
+            # Sections reported while the response was being generated
+            streamed = set()
+
+            def section_generated(name, payload):
+                streamed.add(name)
+                on_section(name, payload)
+
             # Try to get AI analysis
             ai_analysis = self.model.analyze_blood_parameters(
                 data['blood_parameters'],
-                data['patient']
+                data['patient'],
+                should_cancel=should_cancel,
+                on_section=section_generated if on_section else None
             )
+            if ai_analysis.get("cancelled"):
+                return ai_analysis
+
+            # The last section only ends with the response, so it is reported
+            # here, along with any section the streamed text didn't split out
+            if on_section and "error" not in ai_analysis:
+                for name in AI_SECTIONS:
+                    if name not in streamed and ai_analysis.get(name):
+                        on_section(name, ai_analysis[name])
             
             # Add medical disclaimer
             ai_analysis["disclaimer"] = (
@@ -88,7 +182,7 @@ class AnalysisService:
             
             return ai_analysis
         except Exception as e:
-            self.logger.error(f"AI analysis failed: {str(e)}")
+            self.logger.error("AI analysis failed: %s", e)
             return {
                 "error": str(e),
                 "summary": "AI analysis failed. The basic analysis is still available above.",
@@ -154,4 +248,16 @@ class AnalysisService:
             "abnormal_count": len(abnormal_parameters),
             "abnormal_parameters": abnormal_parameters,
             "critical_count": sum(1 for p in abnormal_parameters if p["deviation"] > 20)
-        }
\ No newline at end of file
+        }
+
+
+@functools.cache
+def get_service() -> AnalysisService:
+    """
+    Get the AnalysisService shared by all windows, so the AI model is
+    loaded into memory only once per process.
+    
+    Returns:
+        The shared AnalysisService
+    """
+    return AnalysisService()
@@ -118,10 +118,12 @@ class PDFGenerator:
             # Add test information
             elements.append(Paragraph("Test Information", self.styles['CustomHeading']))
             test_info = data.get('test', {})
+            # Results from before fasting_state moved to the test carry it on the patient
+            fasting = test_info.get('fasting_state', patient_info.get('fasting_state', False))
             test_data = [
                 ["Lab Name:", test_info.get('lab_name', '')],
                 ["Test Date:", str(test_info.get('date', ''))],
-                ["Fasting State:", "Yes" if patient_info.get('fasting_state', False) else "No"],
+                ["Fasting State:", "Yes" if fasting else "No"],
             ]
 
             test_table = Table(test_data, colWidths=[1.5*inch, 4*inch])
@@ -0,0 +1,62 @@
+# tests/test_analysis.py
+import itertools
+import unittest
+
+from app.utils.analysis import STATUS_COLORS, classify_all
+
+
+def _baseline_status(value, range_vals):
+    """Per-parameter classification that classify_all replaced, as it was"""
+    try:
+        if not range_vals or len(range_vals) != 2:
+            return "No range"
+        min_val, max_val = range_vals
+        if min_val is None or max_val is None:
+            return "No range"
+        min_val = float(min_val)
+        max_val = float(max_val)
+        if value < min_val:
+            return "Very Low" if (min_val - value) / min_val * 100 > 20 else "Low"
+        if value > max_val:
+            return "Very High" if (value - max_val) / max_val * 100 > 20 else "High"
+        return "Normal"
+    except Exception:
+        return "Error"
+
+
+class ClassifyAllTest(unittest.TestCase):
+    """classify_all reports the same statuses as the per-parameter code it replaced"""
+
+    RANGES = ([4.0, 10.0], [0, 5.0], [1.0, 0], [None, 5.0], [4.0, None], [], [4.0], ["4.0", "10.0"])
+    VALUES = (-1.0, 0, 3.0, 3.2, 3.3, 4.0, 7.5, 10.0, 12.0, 12.1, 100.0)
+
+    def test_status_parity(self):
+        cases = list(itertools.product(self.VALUES, self.RANGES))
+        parameters = {
+            f"p{i}": {'value': value, 'range': range_vals}
+            for i, (value, range_vals) in enumerate(cases)
+        }
+        results = classify_all(parameters)
+        for i, (value, range_vals) in enumerate(cases):
+            with self.subTest(value=value, range=range_vals):
+                status, color, _ = results[f"p{i}"]
+                self.assertEqual(status, _baseline_status(value, range_vals))
+                self.assertEqual(color, STATUS_COLORS[status])
+
+    def test_sides(self):
+        results = classify_all({
+            'low': {'value': 3.5, 'range': [4.0, 10.0]},
+            'high': {'value': 11.0, 'range': [4.0, 10.0]},
+            'normal': {'value': 5.0, 'range': [4.0, 10.0]},
+            'no_data': {'value': 'N/A', 'range': [4.0, 10.0]},
+            'bad_value': {'value': 'abc', 'range': [4.0, 10.0]},
+        })
+        self.assertEqual(results['low'], ("Low", STATUS_COLORS["Low"], "low"))
+        self.assertEqual(results['high'], ("High", STATUS_COLORS["High"], "high"))
+        self.assertEqual(results['normal'], ("Normal", STATUS_COLORS["Normal"], "normal"))
+        self.assertEqual(results['no_data'], ("No data", STATUS_COLORS["No data"], "unknown"))
+        self.assertEqual(results['bad_value'], ("Error", STATUS_COLORS["Error"], "unknown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+# tests/test_analysis_service.py
+import unittest
+from unittest import mock
+
+try:
+    from app.utils.analysis_service import BASIC_CACHE_SIZE, AnalysisService
+except ImportError:  # torch / transformers not installed
+    AnalysisService = None
+
+
+def _data(**values):
+    return {
+        'patient': {'gender': 'male'},
+        'test': {},
+        'blood_parameters': {
+            name: {'value': value, 'range': [4.0, 10.0]} for name, value in values.items()
+        },
+    }
+
+
+@unittest.skipIf(AnalysisService is None, "AI dependencies are not installed")
+class BasicAnalysisCacheTest(unittest.TestCase):
+    """get_basic_analysis reuses results for the same parameter values and ranges"""
+
+    def setUp(self):
+        self.service = AnalysisService()
+        self.perform = mock.patch.object(
+            self.service, '_perform_basic_analysis',
+            wraps=self.service._perform_basic_analysis).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_same_parameters_hit_the_cache(self):
+        first = self.service.get_basic_analysis(_data(WBC=3.0, RBC=5.0))
+        second = self.service.get_basic_analysis(_data(WBC=3.0, RBC=5.0))
+        self.assertEqual(self.perform.call_count, 1)
+        self.assertIs(first['basic_analysis'], second['basic_analysis'])
+        self.assertEqual(first['basic_analysis']['abnormal_count'], 1)
+
+    def test_key_covers_values_ranges_and_order(self):
+        self.service.get_basic_analysis(_data(WBC=3.0, RBC=5.0))
+        self.service.get_basic_analysis(_data(WBC=3.5, RBC=5.0))
+        self.service.get_basic_analysis(_data(RBC=5.0, WBC=3.0))
+        changed_range = _data(WBC=3.0, RBC=5.0)
+        changed_range['blood_parameters']['WBC']['range'] = [2.0, 10.0]
+        result = self.service.get_basic_analysis(changed_range)
+        self.assertEqual(self.perform.call_count, 4)
+        self.assertEqual(result['basic_analysis']['abnormal_count'], 0)
+
+    def test_oldest_entry_is_evicted(self):
+        for i in range(BASIC_CACHE_SIZE + 1):
+            self.service.get_basic_analysis(_data(WBC=float(i)))
+        self.assertEqual(len(self.service._basic_cache), BASIC_CACHE_SIZE)
+
+        self.service.get_basic_analysis(_data(WBC=float(BASIC_CACHE_SIZE)))
+        self.assertEqual(self.perform.call_count, BASIC_CACHE_SIZE + 1)
+        self.service.get_basic_analysis(_data(WBC=0.0))
+        self.assertEqual(self.perform.call_count, BASIC_CACHE_SIZE + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+# tests/test_parameter_table.py
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QValidator
+from PyQt6.QtWidgets import QApplication
+
+from app.gui.parameter_table import ParameterTableModel, ParameterValueDelegate
+from app.model.parameters.parameter_lookups import PARAM_UI_CACHE_SORTED
+
+_app = QApplication.instance() or QApplication([])
+
+
+class DecimalSeparatorTest(unittest.TestCase):
+    """The validator and the model agree on which separators an entered value may use"""
+
+    def setUp(self):
+        group_name = next(iter(PARAM_UI_CACHE_SORTED))
+        self.model = ParameterTableModel(group_name)
+        self.index = self.model.index(0, ParameterTableModel.VALUE_COLUMN)
+        self.delegate = ParameterValueDelegate()
+        self.validator = self.delegate._validator
+
+    def _enter(self, text):
+        self.model.setData(self.index, text, Qt.ItemDataRole.EditRole)
+        return self.model.values().get(self.model.index(0, 0).data())
+
+    def test_decimal_comma_is_accepted(self):
+        state, _, _ = self.validator.validate("13,5", 4)
+        self.assertEqual(state, QValidator.State.Acceptable)
+        self.assertEqual(self._enter("13,5"), 13.5)
+
+    def test_thousands_group_is_rejected(self):
+        state, _, _ = self.validator.validate("4,500", 5)
+        self.assertEqual(state, QValidator.State.Invalid)
+        self.assertIsNone(self._enter("4,500"))
+
+    def test_empty_field_clears_the_value(self):
+        self._enter("13.5")
+        state, _, _ = self.validator.validate("", 0)
+        self.assertEqual(state, QValidator.State.Acceptable)
+        self.assertIsNone(self._enter(""))
+
+
+if __name__ == "__main__":
+    unittest.main()
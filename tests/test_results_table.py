@@ -0,0 +1,68 @@
+# tests/test_results_table.py
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+from app.gui.results_table import ResultsTableModel
+
+_app = QApplication.instance() or QApplication([])
+
+_RED = QColor("#FF0000")
+_GREEN = QColor("#008000")
+
+
+def _rows(wbc_value="5.0", wbc_color=_GREEN):
+    return [
+        (("Complete Blood Count",), None),
+        (("WBC", wbc_value, "4.0-10.0", "10^9/L", "Normal"), wbc_color),
+        (("RBC", "4.5", "4.0-5.5", "10^12/L", "Normal"), _GREEN),
+    ]
+
+
+class SetRowsTest(unittest.TestCase):
+    """set_rows only resets the model when the row layout changes"""
+
+    def setUp(self):
+        self.model = ResultsTableModel()
+        self.resets = []
+        self.changed = []
+        self.model.modelReset.connect(lambda: self.resets.append(True))
+        self.model.dataChanged.connect(lambda first, last: self.changed.append((first.row(), last.row())))
+
+    def test_first_rows_reset(self):
+        self.assertTrue(self.model.set_rows(_rows()))
+        self.assertEqual(len(self.resets), 1)
+        self.assertEqual(self.model.rowCount(), 3)
+        self.assertTrue(self.model.is_group_row(0))
+        self.assertFalse(self.model.is_group_row(1))
+
+    def test_same_layout_updates_changed_rows(self):
+        self.model.set_rows(_rows())
+        self.assertFalse(self.model.set_rows(_rows(wbc_value="12.5", wbc_color=_RED)))
+        self.assertEqual(len(self.resets), 1)
+        self.assertEqual(self.changed, [(1, 1)])
+        self.assertEqual(self.model.index(1, 1).data(), "12.5")
+
+    def test_unchanged_rows_emit_nothing(self):
+        self.model.set_rows(_rows())
+        self.assertFalse(self.model.set_rows(_rows()))
+        self.assertEqual(self.changed, [])
+
+    def test_new_layout_resets(self):
+        self.model.set_rows(_rows())
+        self.assertTrue(self.model.set_rows(_rows()[:2]))
+        self.assertEqual(len(self.resets), 2)
+        self.assertEqual(self.model.rowCount(), 2)
+
+    def test_no_rows_reset(self):
+        self.model.set_rows([])
+        self.assertTrue(self.model.set_rows([]))
+        self.assertEqual(self.model.rowCount(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+# tests/test_submission.py
+import copy
+import datetime
+import pickle
+import unittest
+from types import MappingProxyType
+
+from app.model.parameters.parameter_definitions import BLOOD_PARAMETERS, freeze, thaw
+from app.model.parameters.parameter_lookups import PARAM_TO_GROUP
+from app.model.submission import ParamResult, PatientData, SubmitPayload, TestData
+
+
+class FreezeThawTest(unittest.TestCase):
+    """freeze makes the definitions read-only and thaw gives back plain data"""
+
+    def test_round_trip(self):
+        value = {'a': [1, {'b': [2, 3]}], 'c': 'text', 'd': None}
+        frozen = freeze(value)
+        self.assertIsInstance(frozen, MappingProxyType)
+        self.assertIsInstance(frozen['a'], tuple)
+        self.assertIsInstance(frozen['a'][1], MappingProxyType)
+        self.assertEqual(thaw(frozen), value)
+
+    def test_definitions_are_read_only(self):
+        group = next(iter(BLOOD_PARAMETERS.values()))
+        with self.assertRaises(TypeError):
+            group['parameters']['new'] = {}
+
+
+class SubmitPayloadTest(unittest.TestCase):
+    """to_dict copies the frozen definitions out into plain, picklable data"""
+
+    def setUp(self):
+        param_name, (group_name, param_info) = next(iter(PARAM_TO_GROUP.items()))
+        self.param_info = param_info
+        self.payload = SubmitPayload(
+            patient=PatientData("Jane", "Doe", "Female", 40, 165.0, 60.0),
+            test=TestData(datetime.date(2024, 1, 2), "Lab", True),
+            blood_parameters=(ParamResult(
+                name=param_name,
+                value=5.0,
+                unit=param_info['unit']['standard'],
+                group=group_name,
+                range_min=4.0,
+                range_max=10.0,
+                metadata=param_info.get('metadata', {}),
+                clinical_info=param_info.get('clinical_info', {})
+            ),),
+            use_ai_analysis=False
+        )
+
+    def _assert_plain(self, value):
+        self.assertNotIsInstance(value, (MappingProxyType, tuple))
+        if isinstance(value, dict):
+            for item in value.values():
+                self._assert_plain(item)
+        elif isinstance(value, list):
+            for item in value:
+                self._assert_plain(item)
+
+    def test_to_dict_is_plain(self):
+        data = self.payload.to_dict()
+        self._assert_plain(data)
+        param = next(iter(data['blood_parameters'].values()))
+        self.assertEqual(param['clinical_info'], thaw(self.param_info['clinical_info']))
+        self.assertEqual(param['range'], [4.0, 10.0])
+
+    def test_to_dict_deepcopies_and_pickles(self):
+        data = self.payload.to_dict()
+        self.assertEqual(copy.deepcopy(data), data)
+        self.assertEqual(pickle.loads(pickle.dumps(data)), data)
+
+    def test_to_dict_leaves_definitions_untouched(self):
+        data = self.payload.to_dict()
+        param = next(iter(data['blood_parameters'].values()))
+        param['clinical_info']['description'] = "changed"
+        self.assertNotEqual(self.param_info['clinical_info'].get('description'), "changed")
+
+
+if __name__ == "__main__":
+    unittest.main()